@@ -0,0 +1,30 @@
+from .article import Article, parse_date
+from .extractors import SITE_CONFIGS, GenericExtractor, SimpleExtractor, SiteExtractor, create_extractor
+from .fetchers import AsyncFetcher, RequestsFetcher, SeleniumFetcher, create_fetcher
+from .quality import QualityCollapse, QualityMonitor, score_extraction
+from .runner import Scraper
+from .sinks import JsonLinesSink, MarkdownSink, create_sink, sanitize_filename
+from .structured_data import extract_structured_article
+
+__all__ = [
+    'Article',
+    'AsyncFetcher',
+    'GenericExtractor',
+    'JsonLinesSink',
+    'MarkdownSink',
+    'QualityCollapse',
+    'QualityMonitor',
+    'RequestsFetcher',
+    'SITE_CONFIGS',
+    'Scraper',
+    'SeleniumFetcher',
+    'SimpleExtractor',
+    'SiteExtractor',
+    'create_extractor',
+    'create_fetcher',
+    'create_sink',
+    'extract_structured_article',
+    'parse_date',
+    'sanitize_filename',
+    'score_extraction',
+]
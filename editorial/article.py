@@ -0,0 +1,153 @@
+import json
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+
+KST = timezone(timedelta(hours=9), 'KST')
+
+_KOREAN_DATE_RE = re.compile(
+    r'(\d{4})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})\s*일?\.?'
+    r'(?:[\sT]*(오전|오후|AM|PM|am|pm)?\s*(\d{1,2}):(\d{2})(?::(\d{2})(?:\.\d+)?)?'
+    r'\s*(Z|[+-]\d{2}:?\d{2})?)?'
+)
+
+
+def parse_iso_date(text):
+    text = text.strip()
+    if text.endswith('Z'):
+        text = text[:-1] + '+00:00'
+
+    try:
+        value = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+    if value.tzinfo is None:
+        return value.replace(tzinfo=KST)
+    return value.astimezone(KST)
+
+
+def parse_korean_date(text):
+    match = _KOREAN_DATE_RE.search(text)
+    if not match:
+        return None
+
+    year, month, day, meridiem, hour, minute, second, offset = match.groups()
+    hour = int(hour or 0)
+    if meridiem in ('오후', 'PM', 'pm') and hour < 12:
+        hour += 12
+    elif meridiem in ('오전', 'AM', 'am') and hour == 12:
+        hour = 0
+
+    tzinfo = KST
+    if offset == 'Z':
+        tzinfo = timezone.utc
+    elif offset:
+        sign = -1 if offset[0] == '-' else 1
+        digits = offset[1:].replace(':', '')
+        tzinfo = timezone(sign * timedelta(hours=int(digits[:2]), minutes=int(digits[2:])))
+
+    try:
+        value = datetime(int(year), int(month), int(day), hour, int(minute or 0), int(second or 0), tzinfo=tzinfo)
+    except ValueError:
+        return None
+    return value.astimezone(KST)
+
+
+def labelled_date_parser(label):
+    # Article date lines carry both the publish and the update time
+    # ("입력 2025.01.05. 18:00 업데이트 2025.01.06. 09:00"), not always in
+    # that order; parse the one after the site's publish label.
+    label_re = re.compile(re.escape(label) + r'\s*:?')
+
+    def parse(text):
+        match = label_re.search(text)
+        if not match:
+            return None
+        return parse_korean_date(text[match.end():])
+
+    return parse
+
+
+# Visible date lines per site. ISO timestamps from JSON-LD or meta tags
+# are tried first for every site (parse_iso_date is strict); the bare
+# parse_korean_date picks up lines without a publish label.
+DATE_PARSERS = {
+    'chosun': (labelled_date_parser('입력'), parse_korean_date),
+    'joongang': (labelled_date_parser('입력'), parse_korean_date),
+    'donga': (labelled_date_parser('입력'), parse_korean_date),
+    'hani': (labelled_date_parser('등록'), parse_korean_date),
+    'khan': (labelled_date_parser('입력'), parse_korean_date),
+}
+
+
+def parse_date(text, site=None):
+    if not text or not isinstance(text, str):
+        return None
+
+    for parser in (parse_iso_date,) + DATE_PARSERS.get(site, (parse_korean_date,)):
+        value = parser(text)
+        if value:
+            return value
+    return None
+
+
+@dataclass
+class Article:
+    __slots__ = ('url', 'title', 'published', 'author', 'body', 'date_text')
+
+    url: str
+    title: str
+    published: Optional[datetime]
+    author: str
+    body: str
+    date_text: str
+
+    @classmethod
+    def from_fields(cls, url, title='', date='', author='', content=(), site=None):
+        published = parse_date(date, site)
+        return cls(
+            url=url,
+            title=title or '',
+            published=published,
+            author=author or '',
+            body='\n'.join(' '.join(paragraph.split()) for paragraph in content),
+            date_text='' if published else (date or '')
+        )
+
+    @property
+    def content(self):
+        return self.body.split('\n') if self.body else []
+
+    @property
+    def date(self):
+        if self.published:
+            return self.published.isoformat()
+        return self.date_text
+
+    @property
+    def timestamp(self):
+        if self.published:
+            return int(self.published.timestamp())
+        return None
+
+    def sort_key(self):
+        return (self.timestamp is None, self.timestamp or 0, self.url)
+
+    def to_record(self):
+        return [self.url, self.title, self.timestamp, self.author, self.body, self.date_text]
+
+    @classmethod
+    def from_record(cls, record):
+        url, title, timestamp, author, body, date_text = record
+        published = datetime.fromtimestamp(timestamp, KST) if timestamp is not None else None
+        return cls(url, title, published, author, body, date_text)
+
+    def to_json(self):
+        return json.dumps(self.to_record(), ensure_ascii=False, separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, line):
+        return cls.from_record(json.loads(line))
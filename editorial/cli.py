@@ -0,0 +1,289 @@
+import argparse
+import os
+import sys
+from itertools import chain
+from .distributed import Worker, enqueue
+from .discovery import LIST_URLS, discover_from_api, discover_from_listing, discover_from_rss
+from .extractors import EXTRACTORS, SITE_CONFIGS, create_extractor
+from .fetchers import FETCHERS, RequestsFetcher, create_fetcher
+from .runner import Scraper
+from .sinks import SINKS, create_sink
+from .urls import iter_lines
+from .workqueue import DEFAULT_MAX_ATTEMPTS, DEFAULT_VISIBILITY_TIMEOUT, open_queue
+
+
+def build_scraper(args, site_name, output_dir):
+    fetcher_options = {'delay': args.delay} if args.delay is not None else {}
+    fetcher = create_fetcher(args.fetcher, **fetcher_options)
+    extractor = create_extractor(args.extractor, site_name)
+    sink = create_sink(args.sink, output_dir)
+    return Scraper(
+        fetcher, extractor, sink,
+        skip_existing=not args.force,
+        dedup_input=getattr(args, 'dedup', False)
+    )
+
+
+def run_scraper(scraper, urls):
+    try:
+        scraper.scrape(urls)
+    finally:
+        scraper.fetcher.close()
+        scraper.sink.close()
+    return 0
+
+
+def cmd_discover(args):
+    base_url = args.url or LIST_URLS.get(args.site)
+    if not base_url:
+        print(f"Error: no listing URL known for '{args.site}', pass --url")
+        return 1
+
+    scraper = build_scraper(args, args.site, os.path.join(args.output_dir, args.site))
+
+    try:
+        article_links = discover_from_listing(scraper.fetcher, args.site, base_url)
+    except Exception as e:
+        print(f"Error: {e}")
+        scraper.fetcher.close()
+        return 1
+
+    if not article_links:
+        print("No articles found!")
+        scraper.fetcher.close()
+        return 1
+
+    return run_scraper(scraper, article_links)
+
+
+def cmd_scrape(args):
+    print("Chosun Editorial Scraper (Simple Version)")
+    print("=" * 50)
+    print()
+
+    with RequestsFetcher() as fetcher:
+        article_links = discover_from_rss(fetcher) or discover_from_api(fetcher)
+
+    if not article_links:
+        print("\n⚠️  Could not fetch article links from API or RSS.")
+        print("The website may require JavaScript rendering.")
+        print("Please use the Selenium-based discover mode instead.")
+        print("\nTo set up Selenium:")
+        print("  1. Run: ./setup.sh")
+        print("  2. Run: python -m editorial discover")
+        return 1
+
+    return run_scraper(build_scraper(args, 'chosun', args.output_dir), article_links)
+
+
+def cmd_manual(args):
+    sources = list(args.file or [])
+    urls = []
+    for value in args.inputs:
+        if value == '-':
+            sources.append(value)
+        else:
+            urls.append(value)
+
+    if not sources and not urls:
+        print("Error: No valid URLs provided")
+        args.parser.print_help()
+        return 1
+
+    scraper = build_scraper(args, 'chosun', args.output_dir)
+    return run_scraper(scraper, chain(urls, iter_lines(sources)) if sources else urls)
+
+
+def open_queue_from_args(args):
+    return open_queue(args.queue, visibility_timeout=args.visibility_timeout, max_attempts=args.max_attempts)
+
+
+def cmd_coordinator(args):
+    sources = list(args.file or [])
+    urls = []
+    for value in args.inputs:
+        if value == '-':
+            sources.append(value)
+        else:
+            urls.append(value)
+
+    if not sources and not urls and not args.requeue_failed:
+        if args.discover == 'rss':
+            with RequestsFetcher() as fetcher:
+                urls = discover_from_rss(fetcher) or discover_from_api(fetcher)
+        else:
+            base_url = args.url or LIST_URLS.get(args.site)
+            if not base_url:
+                print(f"Error: no listing URL known for '{args.site}', pass --url")
+                return 1
+            with create_fetcher(args.fetcher) as fetcher:
+                urls = discover_from_listing(fetcher, args.site, base_url)
+
+        if not urls:
+            print("No articles found!")
+            return 1
+
+    queue = open_queue_from_args(args)
+    try:
+        if args.requeue_failed:
+            print(f"Requeued {queue.requeue_failed()} failed URLs")
+        if sources or urls:
+            enqueue(queue, chain(urls, iter_lines(sources)) if sources else urls)
+        counts = queue.stats()
+    finally:
+        queue.close()
+
+    print(f"Queue: {counts['pending']} pending, {counts['leased']} leased, "
+          f"{counts['done']} done, {counts['failed']} failed")
+    return 0
+
+
+def cmd_worker(args):
+    args.sink = 'markdown'
+    args.force = True
+    scraper = build_scraper(args, args.site, args.output_dir)
+    queue = open_queue_from_args(args)
+
+    worker = Worker(
+        queue,
+        scraper,
+        batch_size=args.batch_size,
+        retry_delay=args.retry_delay,
+        poll_interval=args.poll_interval,
+        wait=args.wait
+    )
+
+    try:
+        return worker.run()
+    finally:
+        scraper.fetcher.close()
+        scraper.sink.close()
+        queue.close()
+
+
+def cmd_tune(args):
+    from .tuning import tune
+    return tune(args.site, args.pages)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m editorial',
+        description='Scrape Korean newspaper editorials into Markdown files.'
+    )
+    subparsers = parser.add_subparsers(dest='command')
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--output-dir', default='articles', help="output directory (default: articles)")
+    common.add_argument('--sink', choices=sorted(SINKS), default='markdown', help="output format (default: markdown)")
+    common.add_argument('--delay', type=float, help="seconds to wait between requests")
+    common.add_argument('--force', action='store_true', help="re-scrape URLs already saved in the output directory")
+
+    discover = subparsers.add_parser(
+        'discover', parents=[common],
+        help="find articles on a site's editorial listing page and scrape them"
+    )
+    discover.add_argument('--site', choices=sorted(SITE_CONFIGS), default='chosun')
+    discover.add_argument('--url', help="editorial listing URL (default: known URL for --site)")
+    discover.add_argument('--fetcher', choices=sorted(FETCHERS), default='selenium')
+    discover.add_argument('--extractor', choices=sorted(EXTRACTORS), default='site')
+    discover.set_defaults(func=cmd_discover)
+
+    scrape = subparsers.add_parser(
+        'scrape', parents=[common],
+        help="find Chosun editorials via RSS/API and scrape them without a browser"
+    )
+    scrape.add_argument('--fetcher', choices=sorted(FETCHERS), default='requests')
+    scrape.add_argument('--extractor', choices=sorted(EXTRACTORS), default='simple')
+    scrape.set_defaults(func=cmd_scrape)
+
+    manual = subparsers.add_parser(
+        'manual', parents=[common],
+        help="scrape article URLs given on the command line, in files or on stdin"
+    )
+    manual.add_argument('inputs', nargs='*', metavar='URL', help="article URL, or '-' to read URLs from stdin")
+    manual.add_argument('--file', action='append', metavar='PATH',
+                        help="read URLs from a file, gzip file or glob pattern (repeatable)")
+    manual.add_argument('--dedup', action='store_true',
+                        help="also skip URLs repeated within the input (keeps every URL in memory)")
+    manual.add_argument('--fetcher', choices=sorted(FETCHERS), default='requests')
+    manual.add_argument('--extractor', choices=sorted(EXTRACTORS), default='generic')
+    manual.set_defaults(func=cmd_manual, parser=manual)
+
+    queue_options = argparse.ArgumentParser(add_help=False)
+    queue_options.add_argument('--queue', required=True,
+                               help="redis://host:port/db, or a SQLite file path for single-host runs")
+    queue_options.add_argument('--visibility-timeout', type=float, default=DEFAULT_VISIBILITY_TIMEOUT,
+                               help=f"seconds before an unacknowledged URL is redelivered (default: {DEFAULT_VISIBILITY_TIMEOUT})")
+    queue_options.add_argument('--max-attempts', type=int, default=DEFAULT_MAX_ATTEMPTS,
+                               help=f"deliveries before a URL is marked failed (default: {DEFAULT_MAX_ATTEMPTS})")
+
+    coordinator = subparsers.add_parser(
+        'coordinator', parents=[queue_options],
+        help="discover article URLs and add them to a shared work queue"
+    )
+    coordinator.add_argument('inputs', nargs='*', metavar='URL', help="article URL, or '-' to read URLs from stdin")
+    coordinator.add_argument('--file', action='append', metavar='PATH',
+                             help="read URLs from a file, gzip file or glob pattern (repeatable)")
+    coordinator.add_argument('--discover', choices=['listing', 'rss'], default='listing',
+                             help="how to find URLs when none are given (default: listing)")
+    coordinator.add_argument('--site', choices=sorted(SITE_CONFIGS), default='chosun')
+    coordinator.add_argument('--url', help="editorial listing URL (default: known URL for --site)")
+    coordinator.add_argument('--fetcher', choices=sorted(FETCHERS), default='selenium',
+                             help="fetcher for the listing page (default: selenium)")
+    coordinator.add_argument('--requeue-failed', action='store_true',
+                             help="put failed URLs back in the queue with their attempts reset "
+                                  "(skips discovery unless URLs are given)")
+    coordinator.set_defaults(func=cmd_coordinator)
+
+    worker = subparsers.add_parser(
+        'worker', parents=[queue_options],
+        help="pull URLs from a shared work queue, scrape them and save Markdown files"
+    )
+    worker.add_argument('--output-dir', default='articles', help="output directory (default: articles)")
+    worker.add_argument('--site', choices=sorted(SITE_CONFIGS), default='chosun')
+    worker.add_argument('--fetcher', choices=sorted(FETCHERS), default='requests')
+    worker.add_argument('--extractor', choices=sorted(EXTRACTORS), default='generic')
+    worker.add_argument('--delay', type=float, help="seconds to wait between requests")
+    worker.add_argument('--batch-size', type=int, default=1, help="URLs leased at a time (default: 1)")
+    worker.add_argument('--retry-delay', type=float, default=60,
+                        help="seconds before a failed URL is retried (default: 60)")
+    worker.add_argument('--poll-interval', type=float, default=5,
+                        help="seconds between polls while other workers hold leases (default: 5)")
+    worker.add_argument('--wait', action='store_true', help="keep polling after the queue is drained")
+    worker.set_defaults(func=cmd_worker)
+
+    tune = subparsers.add_parser(
+        'tune',
+        help="rank content selectors on sample pages and propose a site config"
+    )
+    tune.add_argument('site', choices=sorted(SITE_CONFIGS))
+    tune.add_argument('pages', nargs='+', metavar='PAGE', help="saved article HTML file or article URL")
+    tune.set_defaults(func=cmd_tune)
+
+    parser.commands = subparsers.choices
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    argv = sys.argv[1:] if argv is None else list(argv)
+
+    # Subcommands are parsed on their own so that options may follow the
+    # URL list ("manual - --file urls.gz URL"); argparse cannot intermix
+    # arguments across a subparser boundary.
+    if argv and argv[0] in parser.commands:
+        args = parser.commands[argv[0]].parse_intermixed_args(argv[1:])
+        args.command = argv[0]
+    else:
+        args = parser.parse_args(argv)
+
+    if not args.command:
+        parser.print_help()
+        return 1
+
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+import json
+import re
+from urllib.parse import urljoin
+from .extractors import SITE_CONFIGS, make_soup
+
+
+LIST_URLS = {
+    'chosun': 'https://www.chosun.com/opinion/editorial/',
+}
+
+CHOSUN_API_URL = 'https://www.chosun.com/pf/api/v3/content/fetch/story-feed'
+CHOSUN_RSS_URL = 'https://www.chosun.com/arc/outboundfeeds/rss/?outputType=xml&size=100'
+
+_YEAR_RE = re.compile(r'/20\d{2}')
+
+
+def discover_from_listing(fetcher, site_name, base_url):
+    print(f"Fetching article list from {base_url}...")
+
+    config = SITE_CONFIGS.get(site_name, SITE_CONFIGS['chosun'])
+    soup = make_soup(fetcher.fetch_listing(base_url))
+
+    article_links = set()
+    pattern = config['link_pattern']
+    min_depth = config['url_depth']
+
+    for link in soup.find_all('a', href=True):
+        href = link['href']
+
+        if pattern in href and href != base_url:
+            if not href.startswith('http'):
+                href = urljoin(base_url, href)
+
+            if href.count('/') >= min_depth and _YEAR_RE.search(href):
+                article_links.add(href)
+
+    print(f"Found {len(article_links)} article links")
+    return list(article_links)
+
+
+def discover_from_api(fetcher):
+    print("Trying to fetch articles via API...")
+
+    params = {
+        'query': '{"includeContentTypes":"story","excludeContentTypes":"gallery, video","includeSections":"/opinion/editorial","size":20}',
+        'filter': '{"excludeContentTypes":["gallery","video"],"includeSections":["/opinion/editorial"]}'
+    }
+
+    try:
+        data = json.loads(fetcher.get(CHOSUN_API_URL, params=params).content)
+
+        articles = []
+        for item in data.get('content_elements', []):
+            if 'canonical_url' in item:
+                url = item['canonical_url']
+                if not url.startswith('http'):
+                    url = 'https://www.chosun.com' + url
+                articles.append(url)
+
+        print(f"Found {len(articles)} articles from API")
+        return articles
+    except Exception as e:
+        print(f"API fetch failed: {e}")
+
+    return []
+
+
+def discover_from_rss(fetcher):
+    print("Trying to fetch articles via RSS...")
+
+    try:
+        soup = make_soup(fetcher.get(CHOSUN_RSS_URL).content, 'xml')
+
+        articles = []
+        for item in soup.find_all('item'):
+            link_tag = item.find('link')
+            if link_tag:
+                url = link_tag.get_text(strip=True)
+                if '/opinion/editorial/' in url:
+                    articles.append(url)
+
+        print(f"Found {len(articles)} editorial articles from RSS")
+        return articles
+    except Exception as e:
+        print(f"RSS fetch failed: {e}")
+
+    return []
@@ -0,0 +1,145 @@
+import os
+import socket
+import time
+from .quality import QualityCollapse
+from .urls import canonicalize_url
+
+
+# Responses that will not change on retry; failing them straight away
+# saves max_attempts deliveries of a dead link.
+PERMANENT_STATUS_CODES = (404, 410)
+
+
+def is_permanent_error(error):
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None) in PERMANENT_STATUS_CODES
+
+
+def default_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def enqueue(queue, urls, batch_size=1000):
+    added = 0
+    total = 0
+    batch = []
+
+    for line in urls:
+        url = canonicalize_url(line)
+        if not url:
+            continue
+
+        batch.append(url)
+        if len(batch) >= batch_size:
+            added += queue.put(batch)
+            total += len(batch)
+            batch = []
+
+    if batch:
+        added += queue.put(batch)
+        total += len(batch)
+
+    print(f"Queued {added} new URLs ({total - added} already queued or done)")
+    return added
+
+
+class Worker:
+    def __init__(self, queue, scraper, worker_id=None, batch_size=1, retry_delay=60, poll_interval=5, wait=False):
+        self.queue = queue
+        self.scraper = scraper
+        self.worker_id = worker_id or default_worker_id()
+        self.batch_size = batch_size
+        self.retry_delay = retry_delay
+        self.poll_interval = poll_interval
+        self.wait = wait
+        self.stats = {'successful': 0, 'rejected': 0, 'retried': 0, 'failed': 0, 'lost': 0}
+
+    def _idle(self):
+        counts = self.queue.stats()
+        if not self.wait and not counts['pending'] and not counts['leased']:
+            return False
+
+        time.sleep(self.poll_interval)
+        return True
+
+    def _renewed(self, remaining):
+        # Extend each lease as the fetcher picks its URL up, so a URL late
+        # in a long batch still has a full visibility timeout to finish.
+        for url, lease in list(remaining.items()):
+            if self.queue.extend(lease):
+                yield url
+            else:
+                print(f"\n[{self.worker_id}] Lease on {url} expired, leaving it to another worker")
+                del remaining[url]
+
+    def process(self, leases):
+        remaining = {lease.url: lease for lease in leases}
+
+        for url, raw, error in self.scraper.fetcher.fetch_many(self._renewed(remaining)):
+            lease = remaining.pop(url)
+            print(f"\n[{self.worker_id}] Scraping: {url} (attempt {lease.attempts})")
+
+            try:
+                if error:
+                    raise error
+                saved = self.scraper.scrape_article(url, raw)
+            except Exception as e:
+                print(f"  ✗ Error: {e}")
+                if is_permanent_error(e):
+                    self.queue.fail(lease)
+                    self.stats['failed'] += 1
+                else:
+                    # Transient failure: make the URL visible again after a delay.
+                    self.queue.release(lease, delay=self.retry_delay)
+                    self.stats['retried'] += 1
+            else:
+                if saved:
+                    # The file is written either way, but a lost lease means
+                    # another worker now owns the URL and will count it.
+                    if self.queue.ack(lease):
+                        self.stats['successful'] += 1
+                    else:
+                        print("  ⚠️  Lease expired before the URL was acknowledged")
+                        self.stats['lost'] += 1
+                else:
+                    # Rejections are often a bad page load or a layout
+                    # change that gets fixed, so retry them like errors;
+                    # the queue fails the URL once max_attempts is spent.
+                    self.queue.release(lease, delay=self.retry_delay)
+                    self.stats['rejected'] += 1
+
+            try:
+                self.scraper.quality_monitor.check()
+            except QualityCollapse:
+                for unprocessed in remaining.values():
+                    self.queue.release(unprocessed)
+                raise
+
+    def run(self):
+        print(f"Worker {self.worker_id} started")
+
+        try:
+            while True:
+                leases = self.queue.lease(self.worker_id, self.batch_size)
+                if not leases:
+                    if self._idle():
+                        continue
+                    break
+
+                self.process(leases)
+
+                if self.scraper.fetcher.delay:
+                    time.sleep(self.scraper.fetcher.delay)
+        except QualityCollapse as e:
+            print(f"\n✗ {e}")
+            return 1
+        finally:
+            print(f"\n{'=' * 50}")
+            print(f"✓ Worker {self.worker_id} finished")
+            print(f"  Successful: {self.stats['successful']}")
+            print(f"  Rejected: {self.stats['rejected']}")
+            print(f"  Released for retry: {self.stats['retried']}")
+            print(f"  Failed permanently: {self.stats['failed']}")
+            print(f"  Lost leases: {self.stats['lost']}")
+
+        return 0
@@ -0,0 +1,314 @@
+from .article import Article
+from .quality import score_extraction
+from .structured_data import extract_structured_article, is_complete
+
+
+# Site-specific configurations
+SITE_CONFIGS = {
+    'chosun': {
+        'link_pattern': '/opinion/editorial/',
+        'title_selectors': ['h1', {'tag': ['h1', 'h2'], 'class': ['title', 'headline']}],
+        'date_selectors': ['time', {'class': 'date'}],
+        'author_selectors': [{'class': 'author'}],
+        'content_selectors': ['article', {'class': ['article', 'content', 'body']}],
+        'url_depth': 6
+    },
+    'joongang': {
+        'link_pattern': '/opinion/editorial/',
+        'title_selectors': ['h1', {'class': 'headline'}],
+        'date_selectors': ['time', {'class': ['date', 'published']}],
+        'author_selectors': [{'class': 'author'}, {'class': 'byline'}],
+        'content_selectors': ['article', {'class': ['article_body', 'article-content']}],
+        'url_depth': 5
+    },
+    'donga': {
+        'link_pattern': '/news/Opinion/',
+        'title_selectors': ['h1', {'class': 'title'}],
+        'date_selectors': ['time', {'class': ['date', 'input_date']}],
+        'author_selectors': [{'class': 'author'}, {'class': 'reporter'}],
+        'content_selectors': ['article', {'class': ['article_txt', 'article_content']}],
+        'url_depth': 5
+    },
+    'hani': {
+        'link_pattern': '/arti/opinion/editorial/',
+        'title_selectors': ['h4', {'class': 'title'}, {'tag': 'h3'}],
+        'date_selectors': ['p', {'class': 'date-time'}],
+        'author_selectors': [{'class': 'author'}, {'class': 'reporter_name'}],
+        'content_selectors': ['div', {'class': ['article-text', 'text']}],
+        'url_depth': 5
+    },
+    'khan': {
+        'link_pattern': '/opinion/editorial/',
+        'title_selectors': ['h1', {'class': 'title'}],
+        'date_selectors': ['p', {'class': 'date'}],
+        'author_selectors': [{'class': 'author'}],
+        'content_selectors': ['div', {'class': ['article_body', 'content']}],
+        'url_depth': 6
+    }
+}
+
+SKIP_TERMS = ('copyright', '©', '저작권', 'chosun.com')
+NON_TEXT_TAGS = ('script', 'style', 'noscript', 'template')
+
+
+def make_soup(raw, features='html.parser'):
+    # Imported here so that pages fully covered by structured data never
+    # pay for loading BeautifulSoup.
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(raw, features)
+
+
+def page_text_length(soup):
+    from bs4.element import NavigableString
+
+    return sum(
+        len(text.strip()) for text in soup.find_all(string=True)
+        if type(text) is NavigableString and text.parent.name not in NON_TEXT_TAGS
+    )
+
+
+def _as_list(value):
+    return value if isinstance(value, list) else [value]
+
+
+def _class_contains(class_name):
+    return lambda x: x and class_name in str(x).lower()
+
+
+def find_article_body(soup, content_selectors):
+    for selector in content_selectors:
+        if selector == 'article':
+            article_body = soup.find('article')
+            if article_body:
+                return article_body
+        elif isinstance(selector, dict) and 'class' in selector:
+            for class_name in _as_list(selector['class']):
+                article_body = soup.find('div', class_=_class_contains(class_name))
+                if article_body:
+                    return article_body
+
+    return None
+
+
+def collect_paragraphs(article_body):
+    content_paragraphs = []
+
+    for p in article_body.find_all(['p', 'div'], class_=lambda x: not x or 'ad' not in str(x).lower()):
+        # Only leaf blocks: a wrapper's text would repeat every paragraph
+        # inside it.
+        if p.find(['p', 'div']):
+            continue
+
+        text = p.get_text(strip=True)
+        if text and len(text) > 20 and '©' not in text and 'copyright' not in text.lower() and 'advertisement' not in text.lower():
+            link_text = sum(len(a.get_text(strip=True)) for a in p.find_all('a'))
+            if link_text * 2 <= len(text):
+                content_paragraphs.append(text)
+
+    return content_paragraphs
+
+
+class Extractor:
+    def __init__(self, site_name='chosun'):
+        self.site_name = site_name
+
+    def extract(self, url, raw):
+        return self.extract_scored(url, raw)[0]
+
+    def extract_scored(self, url, raw):
+        structured = extract_structured_article(raw)
+        if is_complete(structured):
+            article = Article.from_fields(url, site=self.site_name, **structured)
+            return article, score_extraction(article.content)
+
+        soup = make_soup(raw)
+
+        article = Article.from_fields(
+            url,
+            title=structured['title'] or self.extract_title(soup),
+            date=structured['date'] or self.extract_date(soup),
+            author=structured['author'] or self.extract_author(soup),
+            content=structured['content'] or self.extract_content(soup),
+            site=self.site_name
+        )
+        quality = score_extraction(article.content, page_text_length(soup))
+        return article, quality
+
+    def extract_title(self, soup):
+        raise NotImplementedError
+
+    def extract_date(self, soup):
+        raise NotImplementedError
+
+    def extract_author(self, soup):
+        raise NotImplementedError
+
+    def extract_content(self, soup):
+        raise NotImplementedError
+
+
+class SiteExtractor(Extractor):
+    def __init__(self, site_name='chosun', config=None):
+        super().__init__(site_name)
+        self.config = config or SITE_CONFIGS.get(site_name, SITE_CONFIGS['chosun'])
+
+    def extract_title(self, soup):
+        for selector in self.config['title_selectors']:
+            if isinstance(selector, str):
+                tag = soup.find(selector)
+                if tag:
+                    return tag.get_text(strip=True)
+            elif isinstance(selector, dict):
+                if 'tag' in selector and 'class' in selector:
+                    for tag_name in _as_list(selector['tag']):
+                        for class_name in _as_list(selector['class']):
+                            tag = soup.find(tag_name, class_=_class_contains(class_name))
+                            if tag:
+                                return tag.get_text(strip=True)
+                elif 'tag' in selector:
+                    for tag_name in _as_list(selector['tag']):
+                        tag = soup.find(tag_name)
+                        if tag:
+                            return tag.get_text(strip=True)
+                elif 'class' in selector:
+                    for class_name in _as_list(selector['class']):
+                        tag = soup.find(class_=_class_contains(class_name))
+                        if tag:
+                            return tag.get_text(strip=True)
+
+        return ''
+
+    def extract_date(self, soup):
+        for selector in self.config['date_selectors']:
+            if selector == 'time':
+                tag = soup.find('time')
+                if tag:
+                    return tag.get('datetime', '') or tag.get_text(strip=True)
+            elif selector == 'p':
+                tag = soup.find('p', class_=_class_contains('date'))
+                if tag:
+                    return tag.get_text(strip=True)
+            elif isinstance(selector, dict) and 'class' in selector:
+                for class_name in _as_list(selector['class']):
+                    tag = soup.find(class_=_class_contains(class_name))
+                    if tag:
+                        return tag.get_text(strip=True)
+
+        return ''
+
+    def extract_author(self, soup):
+        for selector in self.config['author_selectors']:
+            if isinstance(selector, dict) and 'class' in selector:
+                for class_name in _as_list(selector['class']):
+                    tag = soup.find(class_=_class_contains(class_name))
+                    if tag:
+                        return tag.get_text(strip=True)
+
+        return ''
+
+    def extract_content(self, soup):
+        article_body = find_article_body(soup, self.config['content_selectors'])
+
+        if not article_body:
+            article_body = soup.find('div', class_=lambda x: x and any(term in str(x).lower() for term in ['article', 'content', 'body']))
+
+        # No article container means the layout is not one we know; an
+        # empty result scores 0 and feeds the quality monitor rather than
+        # saving whatever <p> tags the page happens to have.
+        if article_body:
+            return collect_paragraphs(article_body)
+        return []
+
+
+class GenericExtractor(Extractor):
+    skip_terms = SKIP_TERMS
+
+    def extract_title(self, soup):
+        title_candidates = [
+            soup.find('h1', class_=_class_contains('headline')),
+            soup.find('h1', class_=_class_contains('title')),
+            soup.find('h1'),
+            soup.find('meta', property='og:title')
+        ]
+
+        for candidate in title_candidates:
+            if candidate:
+                if candidate.name == 'meta':
+                    title = candidate.get('content', '')
+                else:
+                    title = candidate.get_text(strip=True)
+                if title:
+                    return title
+
+        return ''
+
+    def extract_date(self, soup):
+        date_candidates = [
+            soup.find('time'),
+            soup.find(class_=_class_contains('date')),
+            soup.find('meta', property='article:published_time')
+        ]
+
+        for candidate in date_candidates:
+            if candidate:
+                if candidate.name == 'meta':
+                    date = candidate.get('content', '')
+                elif candidate.name == 'time':
+                    date = candidate.get('datetime', '') or candidate.get_text(strip=True)
+                else:
+                    date = candidate.get_text(strip=True)
+                if date:
+                    return date
+
+        return ''
+
+    def extract_author(self, soup):
+        author_tag = soup.find(class_=_class_contains('author'))
+        if author_tag:
+            author = author_tag.get_text(strip=True)
+            if author:
+                return author
+
+        author_meta = soup.find('meta', attrs={'name': 'author'})
+        if author_meta:
+            return author_meta.get('content', '')
+
+        return ''
+
+    def extract_content(self, soup):
+        content_paragraphs = []
+
+        article_body = (
+            soup.find('div', class_=_class_contains('article-body')) or
+            soup.find('div', class_=_class_contains('story-body')) or
+            soup.find('article', class_=_class_contains('content')) or
+            soup.find('div', class_=_class_contains('content-body'))
+        )
+
+        if article_body:
+            for p in article_body.find_all('p', recursive=True):
+                text = p.get_text(strip=True)
+                if text and len(text) > 20:
+                    if not any(skip in text.lower() for skip in self.skip_terms):
+                        content_paragraphs.append(text)
+
+        return content_paragraphs
+
+
+class SimpleExtractor(GenericExtractor):
+    # The filters the RSS/API scrape mode has always used: bylines are
+    # dropped, site footers are kept.
+    skip_terms = ('copyright', '©', '기자', '저작권')
+
+
+EXTRACTORS = {
+    'site': SiteExtractor,
+    'generic': GenericExtractor,
+    'simple': SimpleExtractor,
+}
+
+
+def create_extractor(name, site_name='chosun'):
+    if name not in EXTRACTORS:
+        raise ValueError(f"Unknown extractor '{name}' (choose from {', '.join(EXTRACTORS)})")
+    return EXTRACTORS[name](site_name)
@@ -0,0 +1,144 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+import requests
+from requests.adapters import HTTPAdapter
+
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+
+class Fetcher:
+    def __init__(self, delay=1):
+        self.delay = delay
+
+    def fetch(self, url):
+        raise NotImplementedError
+
+    def fetch_listing(self, url):
+        return self.fetch(url)
+
+    def fetch_many(self, urls):
+        for i, url in enumerate(urls):
+            if i and self.delay:
+                time.sleep(self.delay)
+            try:
+                yield url, self.fetch(url), None
+            except Exception as e:
+                yield url, None, e
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class RequestsFetcher(Fetcher):
+    def __init__(self, delay=1, timeout=30, pool_size=10):
+        super().__init__(delay)
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = USER_AGENT
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get(self, url, **kwargs):
+        response = self.session.get(url, timeout=self.timeout, **kwargs)
+        response.raise_for_status()
+        return response
+
+    def fetch(self, url):
+        return self.get(url).content
+
+    def close(self):
+        self.session.close()
+
+
+class AsyncFetcher(RequestsFetcher):
+    def __init__(self, delay=1, timeout=30, concurrency=8):
+        super().__init__(delay, timeout, pool_size=concurrency)
+        self.concurrency = concurrency
+        self.executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    async def _fetch_one(self, loop, url):
+        try:
+            return url, await loop.run_in_executor(self.executor, self.fetch, url), None
+        except Exception as e:
+            return url, None, e
+
+    async def _fetch_batch(self, urls):
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(self._fetch_one(loop, url) for url in urls))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return results
+
+    def fetch_many(self, urls):
+        urls = iter(urls)
+        while True:
+            batch = list(islice(urls, self.concurrency))
+            if not batch:
+                return
+            yield from asyncio.run(self._fetch_batch(batch))
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+        super().close()
+
+
+class SeleniumFetcher(Fetcher):
+    def __init__(self, delay=2, render_wait=3, listing_wait=5):
+        super().__init__(delay)
+        self.render_wait = render_wait
+        self.listing_wait = listing_wait
+        self.driver = None
+
+    def setup_driver(self):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
+        chrome_options = Options()
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument(f'user-agent={USER_AGENT}')
+
+        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver.implicitly_wait(10)
+
+    def fetch(self, url, render_wait=None):
+        if not self.driver:
+            self.setup_driver()
+
+        self.driver.get(url)
+        time.sleep(self.render_wait if render_wait is None else render_wait)
+        return self.driver.page_source
+
+    def fetch_listing(self, url):
+        return self.fetch(url, render_wait=self.listing_wait)
+
+    def close(self):
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+
+
+FETCHERS = {
+    'requests': RequestsFetcher,
+    'async': AsyncFetcher,
+    'selenium': SeleniumFetcher,
+}
+
+
+def create_fetcher(name, **kwargs):
+    if name not in FETCHERS:
+        raise ValueError(f"Unknown fetcher '{name}' (choose from {', '.join(FETCHERS)})")
+    return FETCHERS[name](**kwargs)
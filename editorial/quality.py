@@ -0,0 +1,108 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+
+MIN_QUALITY = 0.5
+QUALITY_WINDOW = 5
+
+# Paragraphs containing these terms are treated as page chrome rather than
+# editorial text.
+BOILERPLATE_TERMS = (
+    'copyright', '©', '저작권', '무단 전재', '무단전재', '재배포',
+    'advertisement', '광고', '구독', '뉴스레터', '바로가기', '많이 본 뉴스',
+    'chosun.com', 'all rights reserved'
+)
+
+TARGET_PARAGRAPHS = 5
+TARGET_LENGTH = 800
+TARGET_DENSITY = 0.4
+
+
+class QualityCollapse(Exception):
+    pass
+
+
+@dataclass
+class QualityScore:
+    __slots__ = ('paragraphs', 'text_length', 'density', 'boilerplate_ratio', 'score')
+
+    paragraphs: int
+    text_length: int
+    density: Optional[float]
+    boilerplate_ratio: float
+    score: float
+
+    def __str__(self):
+        density = f"{self.density:.2f}" if self.density is not None else '-'
+        return (
+            f"score={self.score:.2f} paragraphs={self.paragraphs} "
+            f"chars={self.text_length} density={density} "
+            f"boilerplate={self.boilerplate_ratio:.2f}"
+        )
+
+
+def is_boilerplate(text):
+    lowered = text.lower()
+    return any(term in lowered for term in BOILERPLATE_TERMS)
+
+
+def score_extraction(paragraphs, page_text_length=None):
+    seen = set()
+    boilerplate = 0
+    text_length = 0
+
+    for text in paragraphs:
+        if text in seen or is_boilerplate(text):
+            boilerplate += 1
+        else:
+            text_length += len(text)
+        seen.add(text)
+
+    count = len(paragraphs)
+    boilerplate_ratio = boilerplate / count if count else 1.0
+
+    score = (
+        0.35 * min(count / TARGET_PARAGRAPHS, 1.0) +
+        0.45 * min(text_length / TARGET_LENGTH, 1.0) +
+        0.2 * (1.0 - boilerplate_ratio)
+    )
+
+    density = None
+    if page_text_length:
+        density = min(text_length / page_text_length, 1.0)
+        score *= 0.5 + 0.5 * min(density / TARGET_DENSITY, 1.0)
+
+    if not count:
+        score = 0.0
+
+    return QualityScore(count, text_length, density, boilerplate_ratio, score)
+
+
+class QualityMonitor:
+    def __init__(self, site_name, threshold=MIN_QUALITY, window=QUALITY_WINDOW):
+        self.site_name = site_name
+        self.threshold = threshold
+        self.recent = deque(maxlen=window)
+
+    def accepts(self, quality):
+        return quality.score >= self.threshold
+
+    def record(self, quality):
+        self.recent.append(quality.score)
+
+    @property
+    def collapsed(self):
+        if len(self.recent) < self.recent.maxlen:
+            return False
+        return sum(self.recent) / len(self.recent) < self.threshold
+
+    def check(self):
+        if self.collapsed:
+            average = sum(self.recent) / len(self.recent)
+            raise QualityCollapse(
+                f"Extraction quality for '{self.site_name}' collapsed "
+                f"(average {average:.2f} over last {len(self.recent)} articles, "
+                f"threshold {self.threshold:.2f}). The site layout may have changed; "
+                f"run 'python -m editorial tune' on a few sample pages."
+            )
@@ -0,0 +1,93 @@
+from .quality import QualityCollapse, QualityMonitor
+from .urls import canonicalize_url
+
+
+class Scraper:
+    def __init__(self, fetcher, extractor, sink, skip_existing=True, dedup_input=False, monitor=None):
+        self.fetcher = fetcher
+        self.extractor = extractor
+        self.sink = sink
+        self.skip_existing = skip_existing
+        # Remembering every streamed URL costs memory proportional to the
+        # input, so repeats within one run are only dropped on request.
+        self.dedup_input = dedup_input
+        self.quality_monitor = monitor or QualityMonitor(extractor.site_name)
+        self.scraped_urls = None
+        self.stats = {}
+
+    def _pending(self, urls):
+        for line in urls:
+            url = canonicalize_url(line)
+            if not url:
+                if line.strip() and not line.lstrip().startswith('#'):
+                    self.stats['invalid'] += 1
+                continue
+
+            if url in self.scraped_urls:
+                self.stats['skipped'] += 1
+                continue
+
+            if self.dedup_input:
+                self.scraped_urls.add(url)
+            yield url
+
+    def scrape_article(self, url, raw):
+        article, quality = self.extractor.extract_scored(url, raw)
+        self.quality_monitor.record(quality)
+
+        if not self.quality_monitor.accepts(quality):
+            print(f"  ⚠️  Low extraction quality ({quality}), skipping...")
+            return False
+
+        return self.sink.save(article)
+
+    def scrape(self, urls):
+        if self.scraped_urls is None:
+            self.scraped_urls = self.sink.scraped_urls() if self.skip_existing else set()
+
+        self.stats = {'successful': 0, 'failed': 0, 'skipped': 0, 'invalid': 0}
+
+        total = len(urls) if hasattr(urls, '__len__') else None
+        if total is None:
+            print("\nStarting to scrape articles as URLs stream in...\n")
+        else:
+            print(f"\nStarting to scrape {total} articles...\n")
+
+        i = 0
+        for url, raw, error in self.fetcher.fetch_many(self._pending(urls)):
+            i += 1
+            print(f"[{i}/{total}]" if total else f"[{i}]", end=' ')
+            print(f"\nScraping: {url}")
+
+            try:
+                if error:
+                    raise error
+                saved = self.scrape_article(url, raw)
+            except Exception as e:
+                print(f"  ✗ Error: {e}")
+                saved = False
+
+            if saved:
+                self.stats['successful'] += 1
+            else:
+                print("  ✗ Failed to extract content")
+                self.stats['failed'] += 1
+
+            try:
+                self.quality_monitor.check()
+            except QualityCollapse as e:
+                print(f"\n✗ {e}")
+                break
+
+        if not i:
+            print("No new URLs to scrape!")
+
+        print(f"\n{'=' * 50}")
+        print(f"✓ Scraping complete!")
+        print(f"  Successful: {self.stats['successful']}")
+        print(f"  Failed: {self.stats['failed']}")
+        print(f"  Skipped (already scraped): {self.stats['skipped']}")
+        print(f"  Invalid lines: {self.stats['invalid']}")
+        print(f"  Articles saved to '{self.sink.output_dir}/' directory")
+
+        return self.stats
@@ -0,0 +1,141 @@
+import glob
+import os
+import re
+from .article import Article
+from .urls import canonicalize_url
+
+
+SOURCE_PREFIX = '**출처:** ['
+
+
+def sanitize_filename(text):
+    text = re.sub(r'[<>:"/\\|?*]', '', text)
+    text = re.sub(r'\s+', '_', text)
+    return text[:100]
+
+
+class Sink:
+    def __init__(self, output_dir='articles'):
+        self.output_dir = output_dir
+
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+
+    def save(self, article):
+        raise NotImplementedError
+
+    def scraped_urls(self):
+        return set()
+
+    def close(self):
+        pass
+
+
+class MarkdownSink(Sink):
+    def save(self, article):
+        if not article.title:
+            print("  ⚠️  No title found, skipping...")
+            return False
+
+        if not article.body:
+            print("  ⚠️  No content found, skipping...")
+            return False
+
+        filename = sanitize_filename(article.title) + '.md'
+        filepath = os.path.join(self.output_dir, filename)
+        # Write to a temporary file and rename it into place, so a worker
+        # that dies mid-write (and is redelivered) never leaves a partial file.
+        tmp_path = f"{filepath}.{os.getpid()}.tmp"
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(f"# {article.title}\n\n")
+
+            if article.date:
+                f.write(f"**날짜:** {article.date}\n\n")
+
+            if article.author:
+                f.write(f"**저자:** {article.author}\n\n")
+
+            f.write(f"{SOURCE_PREFIX}{article.url}]({article.url})\n\n")
+            f.write("---\n\n")
+
+            for paragraph in article.content:
+                f.write(f"{paragraph}\n\n")
+
+        os.replace(tmp_path, filepath)
+        print(f"  ✓ Saved to {filename}")
+        return True
+
+    def scraped_urls(self):
+        scraped = set()
+
+        for filepath in glob.iglob(os.path.join(self.output_dir, '*.md')):
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.startswith(SOURCE_PREFIX):
+                            url = canonicalize_url(line[len(SOURCE_PREFIX):].split(']', 1)[0])
+                            if url:
+                                scraped.add(url)
+                            break
+                        if line.startswith('---'):
+                            break
+            except OSError:
+                continue
+
+        return scraped
+
+
+class JsonLinesSink(Sink):
+    def __init__(self, output_dir='articles', filename='articles.jsonl'):
+        super().__init__(output_dir)
+        self.filepath = os.path.join(output_dir, filename)
+        self.file = None
+
+    def save(self, article):
+        if not article.title or not article.body:
+            print("  ⚠️  No title or content found, skipping...")
+            return False
+
+        if self.file is None:
+            self.file = open(self.filepath, 'a', encoding='utf-8')
+
+        self.file.write(article.to_json() + '\n')
+        self.file.flush()
+
+        print(f"  ✓ Appended to {os.path.basename(self.filepath)}")
+        return True
+
+    def scraped_urls(self):
+        scraped = set()
+
+        if not os.path.exists(self.filepath):
+            return scraped
+
+        with open(self.filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    url = canonicalize_url(Article.from_json(line).url)
+                except (ValueError, TypeError):
+                    continue
+                if url:
+                    scraped.add(url)
+
+        return scraped
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+
+SINKS = {
+    'markdown': MarkdownSink,
+    'jsonl': JsonLinesSink,
+}
+
+
+def create_sink(name, output_dir='articles'):
+    if name not in SINKS:
+        raise ValueError(f"Unknown sink '{name}' (choose from {', '.join(SINKS)})")
+    return SINKS[name](output_dir)
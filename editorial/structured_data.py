@@ -0,0 +1,210 @@
+import html
+import json
+import re
+
+
+ARTICLE_TYPES = {
+    'Article',
+    'NewsArticle',
+    'OpinionNewsArticle',
+    'ReportageNewsArticle',
+    'AnalysisNewsArticle',
+    'BlogPosting',
+}
+
+_LD_JSON_MARKER = b'application/ld+json'
+_FUSION_MARKER = b'Fusion.globalContent='
+_SCRIPT_END = b'</script>'
+_HEAD_END = b'</head>'
+
+_META_TAG_RE = re.compile(rb'<meta\s[^>]*>', re.IGNORECASE)
+_META_KEY_RE = re.compile(rb'(?:property|name)\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+_META_CONTENT_RE = re.compile(rb'content\s*=\s*(?:"([^"]*)"|\'([^\']*)\')', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_BREAK_RE = re.compile(r'<br\s*/?>|</?(?:p|div|li|blockquote|h[1-6])\b[^>]*>', re.IGNORECASE)
+
+# CMSes routinely emit raw newlines and tabs inside JSON strings
+# (articleBody especially), which strict parsing rejects.
+_decoder = json.JSONDecoder(strict=False)
+
+
+def _empty_article():
+    return {
+        'title': '',
+        'date': '',
+        'author': '',
+        'content': []
+    }
+
+
+def _string(value):
+    return value if isinstance(value, str) else ''
+
+
+def _dict(value):
+    return value if isinstance(value, dict) else {}
+
+
+def _list(value):
+    return value if isinstance(value, list) else []
+
+
+def _strip_html(text):
+    text = _BREAK_RE.sub('\n', text)
+    return html.unescape(_TAG_RE.sub('', text)).strip()
+
+
+def _strip_html_line(text):
+    return ' '.join(_strip_html(text).split())
+
+
+def _author_names(value):
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        name = value.get('name') or value.get('byline') or ''
+        return [name] if isinstance(name, str) and name else []
+    if isinstance(value, list):
+        names = []
+        for item in value:
+            names.extend(_author_names(item))
+        return names
+    return []
+
+
+def _iter_script_bodies(raw, marker):
+    pos = raw.find(marker)
+    while pos != -1:
+        start = raw.find(b'>', pos)
+        if start == -1:
+            return
+        end = raw.find(_SCRIPT_END, start)
+        if end == -1:
+            return
+        yield raw[start + 1:end]
+        pos = raw.find(marker, end)
+
+
+def _iter_ld_nodes(data):
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_ld_nodes(item)
+    elif isinstance(data, dict):
+        if '@graph' in data:
+            yield from _iter_ld_nodes(data['@graph'])
+        yield data
+
+
+def _is_article_node(node):
+    node_type = node.get('@type')
+    if isinstance(node_type, list):
+        return any(t in ARTICLE_TYPES for t in node_type)
+    return node_type in ARTICLE_TYPES
+
+
+def extract_fusion(raw):
+    pos = raw.find(_FUSION_MARKER)
+    if pos == -1:
+        return None
+
+    start = pos + len(_FUSION_MARKER)
+    end = raw.find(_SCRIPT_END, start)
+    chunk = raw[start:end if end != -1 else len(raw)].decode('utf-8', errors='replace')
+
+    try:
+        story, _ = _decoder.raw_decode(chunk)
+    except ValueError:
+        return None
+
+    if not isinstance(story, dict):
+        return None
+
+    article = _empty_article()
+    article['title'] = _strip_html_line(_string(_dict(story.get('headlines')).get('basic')))
+    article['date'] = _string(story.get('display_date')) or _string(story.get('first_publish_date'))
+    article['author'] = ', '.join(_author_names(_dict(story.get('credits')).get('by')))
+
+    for element in _list(story.get('content_elements')):
+        if not isinstance(element, dict) or element.get('type') != 'text':
+            continue
+        text = _strip_html_line(_string(element.get('content')))
+        if text:
+            article['content'].append(text)
+
+    return article
+
+
+def extract_json_ld(raw):
+    for body in _iter_script_bodies(raw, _LD_JSON_MARKER):
+        try:
+            data = json.loads(body.decode('utf-8', errors='replace'), strict=False)
+        except ValueError:
+            continue
+
+        for node in _iter_ld_nodes(data):
+            if not _is_article_node(node):
+                continue
+
+            article = _empty_article()
+            article['title'] = _strip_html_line(_string(node.get('headline')) or _string(node.get('name')))
+            article['date'] = _string(node.get('datePublished')) or _string(node.get('dateCreated'))
+            article['author'] = ', '.join(_author_names(node.get('author')))
+            article['content'] = [
+                line.strip() for line in _strip_html(_string(node.get('articleBody'))).splitlines()
+                if line.strip()
+            ]
+            return article
+
+    return None
+
+
+def extract_meta(raw):
+    head_end = raw.find(_HEAD_END)
+    head = raw[:head_end] if head_end != -1 else raw
+
+    meta = {}
+    for tag in _META_TAG_RE.findall(head):
+        key = _META_KEY_RE.search(tag)
+        content = _META_CONTENT_RE.search(tag)
+        if key and content:
+            name = key.group(1).decode('utf-8', errors='replace').lower()
+            value = content.group(1) if content.group(1) is not None else content.group(2)
+            meta.setdefault(name, html.unescape(value.decode('utf-8', errors='replace')).strip())
+
+    article = _empty_article()
+    article['title'] = meta.get('og:title', '')
+    article['date'] = meta.get('article:published_time', '')
+    article['author'] = meta.get('author', '') or meta.get('article:author', '')
+    return article
+
+
+def extract_structured_article(raw):
+    if isinstance(raw, str):
+        raw = raw.encode('utf-8')
+
+    article = _empty_article()
+
+    for extractor in (extract_fusion, extract_json_ld, extract_meta):
+        try:
+            found = extractor(raw)
+        except (TypeError, AttributeError, ValueError):
+            # Malformed payload: treat this tier as missing and let the
+            # next one (or the soup fallback) fill in.
+            found = None
+        if not found:
+            continue
+
+        for key in ('title', 'date', 'author', 'content'):
+            if not article[key] and found[key]:
+                article[key] = found[key]
+
+        if all(article[key] for key in ('title', 'date', 'content')):
+            break
+
+    return article
+
+
+def is_complete(article):
+    return bool(article['title'] and article['content'])
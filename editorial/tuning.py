@@ -0,0 +1,132 @@
+from pprint import pformat
+from .extractors import SITE_CONFIGS, collect_paragraphs, find_article_body, make_soup, page_text_length
+from .fetchers import RequestsFetcher
+from .quality import MIN_QUALITY, score_extraction
+from .structured_data import extract_structured_article, is_complete
+
+
+MAX_SELECTORS = 3
+
+
+def load_page(source, fetcher):
+    if source.startswith('http'):
+        return fetcher.fetch(source)
+
+    with open(source, 'rb') as f:
+        return f.read()
+
+
+def candidate_selectors(soup):
+    candidates = []
+    seen = set()
+
+    if soup.find('article'):
+        candidates.append('article')
+
+    for div in soup.find_all('div', class_=True):
+        if not div.find('p'):
+            continue
+        for class_name in div.get('class', []):
+            class_name = class_name.lower()
+            if class_name not in seen:
+                seen.add(class_name)
+                candidates.append({'class': class_name})
+
+    return candidates
+
+
+def selector_key(selector):
+    return selector if isinstance(selector, str) else f"div.{selector['class']}"
+
+
+def score_selector(soup, selector, text_length):
+    article_body = find_article_body(soup, [selector])
+    paragraphs = collect_paragraphs(article_body) if article_body else []
+    return score_extraction(paragraphs, text_length)
+
+
+def rank_selectors(pages, current_selectors):
+    totals = {}
+    selectors = {}
+    baseline = []
+    structured = 0
+
+    for raw in pages:
+        if is_complete(extract_structured_article(raw)):
+            structured += 1
+
+        soup = make_soup(raw)
+        text_length = page_text_length(soup)
+
+        article_body = find_article_body(soup, current_selectors)
+        paragraphs = collect_paragraphs(article_body) if article_body else []
+        baseline.append(score_extraction(paragraphs, text_length).score)
+
+        for selector in candidate_selectors(soup):
+            key = selector_key(selector)
+            selectors[key] = selector
+            totals[key] = totals.get(key, 0.0) + score_selector(soup, selector, text_length).score
+
+    # Selectors missing from a page contribute 0 for that page. Candidates
+    # come in document order, so on equal scores the later, innermost
+    # container wins over a wrapper that holds the same paragraphs.
+    ranking = [
+        (score, selector) for index, score, selector in sorted(
+            ((index, totals[key] / len(pages), selectors[key]) for index, key in enumerate(totals)),
+            key=lambda item: (round(item[1], 6), item[0]),
+            reverse=True
+        )
+    ]
+    return ranking, sum(baseline) / len(baseline), structured
+
+
+def propose_config(config, ranking):
+    content_selectors = [
+        selector for score, selector in ranking[:MAX_SELECTORS]
+        if score >= MIN_QUALITY
+    ]
+    if not content_selectors:
+        return None
+
+    proposed = dict(config)
+    proposed['content_selectors'] = content_selectors
+    return proposed
+
+
+def tune(site_name, sources):
+    if site_name not in SITE_CONFIGS:
+        print(f"Error: unknown site '{site_name}'")
+        return 1
+    config = SITE_CONFIGS[site_name]
+
+    pages = []
+    with RequestsFetcher() as fetcher:
+        for source in sources:
+            try:
+                pages.append(load_page(source, fetcher))
+            except Exception as e:
+                print(f"Error loading {source}: {e}")
+
+    if not pages:
+        print("Error: no sample pages could be loaded")
+        return 1
+
+    ranking, baseline, structured = rank_selectors(pages, config['content_selectors'])
+
+    print(f"Sample pages: {len(pages)}")
+    print(f"Pages with complete structured data: {structured}/{len(pages)}")
+    print(f"Current content_selectors score: {baseline:.2f}")
+    print()
+    print("Top candidate selectors:")
+    for score, selector in ranking[:10]:
+        print(f"  {score:.2f}  {selector_key(selector)}")
+    print()
+
+    proposed = propose_config(config, ranking)
+    if not proposed:
+        print(f"No candidate selector scored above {MIN_QUALITY:.2f}.")
+        return 1
+
+    print("Proposed SITE_CONFIGS entry:")
+    print(f"'{site_name}': {pformat(proposed, sort_dicts=False)}")
+    return 0
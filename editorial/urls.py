@@ -0,0 +1,70 @@
+import glob
+import gzip
+import sys
+from urllib.parse import urlparse, urlunparse
+
+
+TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid')
+
+
+def canonicalize_url(line):
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return None
+
+    parsed = urlparse(line)
+    if parsed.scheme.lower() not in ('http', 'https') or not parsed.netloc:
+        return None
+
+    # The canonical URL is also the one that gets fetched, so the query is
+    # filtered piece by piece and never re-encoded: 'view?1234' and
+    # 'path=/a/b&q=a%20b' must reach the server unchanged.
+    query = [
+        piece for piece in parsed.query.split('&')
+        if piece and not piece.split('=', 1)[0].lower().startswith(TRACKING_PARAMS)
+    ]
+    return urlunparse((
+        parsed.scheme.lower(),
+        parsed.netloc.lower(),
+        parsed.path or '/',
+        parsed.params,
+        '&'.join(query),
+        ''
+    ))
+
+
+def expand_sources(patterns):
+    for pattern in patterns:
+        if pattern != '-' and glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern))
+            if not matches:
+                print(f"Warning: no files match {pattern}")
+            yield from matches
+        else:
+            yield pattern
+
+
+def open_source(path):
+    if path == '-':
+        return sys.stdin
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+    return open(path, 'r', encoding='utf-8', errors='replace')
+
+
+def iter_lines(patterns):
+    for path in expand_sources(patterns):
+        print(f"Reading URLs from {'stdin' if path == '-' else path}...")
+        try:
+            f = open_source(path)
+        except OSError as e:
+            print(f"Error reading file: {e}")
+            continue
+
+        try:
+            yield from f
+        except OSError as e:
+            print(f"Error reading file: {e}")
+        finally:
+            if f is not sys.stdin:
+                f.close()
@@ -0,0 +1,366 @@
+import sqlite3
+import time
+import uuid
+from dataclasses import dataclass
+
+
+DEFAULT_VISIBILITY_TIMEOUT = 300
+DEFAULT_MAX_ATTEMPTS = 5
+
+
+@dataclass
+class Lease:
+    __slots__ = ('url', 'token', 'attempts')
+
+    url: str
+    token: str
+    attempts: int
+
+
+class WorkQueue:
+    def __init__(self, visibility_timeout=DEFAULT_VISIBILITY_TIMEOUT, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+
+    def put(self, urls):
+        raise NotImplementedError
+
+    def lease(self, worker_id, count=1):
+        raise NotImplementedError
+
+    def extend(self, lease):
+        raise NotImplementedError
+
+    def ack(self, lease):
+        raise NotImplementedError
+
+    def fail(self, lease):
+        raise NotImplementedError
+
+    def release(self, lease, delay=0):
+        raise NotImplementedError
+
+    def requeue_failed(self):
+        raise NotImplementedError
+
+    def stats(self):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class SQLiteQueue(WorkQueue):
+    # Local stand-in for RedisQueue: safe for many worker processes on one
+    # host, but not for a database file shared over a network filesystem.
+
+    def __init__(self, path, visibility_timeout=DEFAULT_VISIBILITY_TIMEOUT, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        super().__init__(visibility_timeout, max_attempts)
+        self.path = path
+        self.db = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS jobs ('
+            ' url TEXT PRIMARY KEY,'
+            ' state TEXT NOT NULL DEFAULT \'pending\','
+            ' visible_at REAL NOT NULL DEFAULT 0,'
+            ' attempts INTEGER NOT NULL DEFAULT 0,'
+            ' token TEXT,'
+            ' worker TEXT)'
+        )
+        self.db.execute('CREATE INDEX IF NOT EXISTS jobs_visible ON jobs (state, visible_at)')
+
+    def put(self, urls):
+        before = self.db.total_changes
+        self.db.execute('BEGIN IMMEDIATE')
+        try:
+            self.db.executemany('INSERT OR IGNORE INTO jobs (url) VALUES (?)', ((url,) for url in urls))
+            self.db.execute('COMMIT')
+        except Exception:
+            self.db.execute('ROLLBACK')
+            raise
+        return self.db.total_changes - before
+
+    def lease(self, worker_id, count=1):
+        now = time.time()
+        token = uuid.uuid4().hex
+        leases = []
+
+        self.db.execute('BEGIN IMMEDIATE')
+        try:
+            rows = self.db.execute(
+                'SELECT url, attempts FROM jobs WHERE state = \'pending\' AND visible_at <= ? '
+                'ORDER BY visible_at LIMIT ?',
+                (now, count)
+            ).fetchall()
+
+            for url, attempts in rows:
+                attempts += 1
+                if attempts > self.max_attempts:
+                    self.db.execute(
+                        'UPDATE jobs SET state = \'failed\', attempts = ?, token = NULL WHERE url = ?',
+                        (attempts, url)
+                    )
+                    continue
+
+                self.db.execute(
+                    'UPDATE jobs SET visible_at = ?, attempts = ?, token = ?, worker = ? WHERE url = ?',
+                    (now + self.visibility_timeout, attempts, token, worker_id, url)
+                )
+                leases.append(Lease(url, token, attempts))
+
+            self.db.execute('COMMIT')
+        except Exception:
+            self.db.execute('ROLLBACK')
+            raise
+
+        return leases
+
+    def extend(self, lease):
+        cursor = self.db.execute(
+            'UPDATE jobs SET visible_at = ? WHERE url = ? AND token = ? AND state = \'pending\'',
+            (time.time() + self.visibility_timeout, lease.url, lease.token)
+        )
+        return cursor.rowcount == 1
+
+    def ack(self, lease):
+        cursor = self.db.execute(
+            'UPDATE jobs SET state = \'done\', token = NULL WHERE url = ? AND token = ? AND state = \'pending\'',
+            (lease.url, lease.token)
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, lease):
+        cursor = self.db.execute(
+            'UPDATE jobs SET state = \'failed\', token = NULL WHERE url = ? AND token = ? AND state = \'pending\'',
+            (lease.url, lease.token)
+        )
+        return cursor.rowcount == 1
+
+    def release(self, lease, delay=0):
+        cursor = self.db.execute(
+            'UPDATE jobs SET visible_at = ?, token = NULL WHERE url = ? AND token = ? AND state = \'pending\'',
+            (time.time() + delay, lease.url, lease.token)
+        )
+        return cursor.rowcount == 1
+
+    def requeue_failed(self):
+        cursor = self.db.execute(
+            'UPDATE jobs SET state = \'pending\', visible_at = 0, attempts = 0, token = NULL, worker = NULL '
+            'WHERE state = \'failed\''
+        )
+        return cursor.rowcount
+
+    def stats(self):
+        now = time.time()
+        counts = {'pending': 0, 'leased': 0, 'done': 0, 'failed': 0}
+
+        for state, leased, count in self.db.execute(
+            'SELECT state, state = \'pending\' AND token IS NOT NULL AND visible_at > ?, COUNT(*) '
+            'FROM jobs GROUP BY 1, 2',
+            (now,)
+        ):
+            counts['leased' if leased else state] += count
+
+        return counts
+
+    def close(self):
+        self.db.close()
+
+
+class RedisQueue(WorkQueue):
+    # Pending URLs live in a sorted set scored by the time they become
+    # visible; leasing a URL pushes its score out by the visibility timeout.
+    # Scores come from the Redis server clock, so workers on hosts with
+    # skewed clocks still agree on when a lease expires (TIME before a
+    # write needs Redis 5+ or script effects replication).
+
+    SERVER_TIME = """
+    local time = redis.call('TIME')
+    local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+    """
+
+    PUT_SCRIPT = """
+    local added = 0
+    for i, url in ipairs(ARGV) do
+        if redis.call('SISMEMBER', KEYS[2], url) == 0 and redis.call('SISMEMBER', KEYS[3], url) == 0 then
+            added = added + redis.call('ZADD', KEYS[1], 'NX', 0, url)
+        end
+    end
+    return added
+    """
+
+    LEASE_SCRIPT = SERVER_TIME + """
+    local timeout = tonumber(ARGV[1])
+    local max_attempts = tonumber(ARGV[3])
+    local leased = {}
+    local urls = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', now, 'LIMIT', 0, tonumber(ARGV[2]))
+    for i, url in ipairs(urls) do
+        local attempts = redis.call('HINCRBY', KEYS[2], url, 1)
+        if attempts > max_attempts then
+            redis.call('ZREM', KEYS[1], url)
+            redis.call('HDEL', KEYS[3], url)
+            redis.call('SADD', KEYS[4], url)
+        else
+            redis.call('ZADD', KEYS[1], now + timeout, url)
+            redis.call('HSET', KEYS[3], url, ARGV[4])
+            table.insert(leased, url)
+            table.insert(leased, attempts)
+        end
+    end
+    return leased
+    """
+
+    EXTEND_SCRIPT = SERVER_TIME + """
+    if redis.call('HGET', KEYS[2], ARGV[1]) == ARGV[2] and redis.call('ZSCORE', KEYS[1], ARGV[1]) then
+        redis.call('ZADD', KEYS[1], now + tonumber(ARGV[3]), ARGV[1])
+        return 1
+    end
+    return 0
+    """
+
+    # Acknowledging and failing both finish a URL, so like RELEASE_SCRIPT
+    # they only act for the worker whose token is still on it.
+    ACK_SCRIPT = """
+    if redis.call('HGET', KEYS[2], ARGV[1]) ~= ARGV[2] then
+        return 0
+    end
+    redis.call('ZREM', KEYS[1], ARGV[1])
+    redis.call('HDEL', KEYS[2], ARGV[1])
+    redis.call('HDEL', KEYS[3], ARGV[1])
+    redis.call('SADD', KEYS[4], ARGV[1])
+    return 1
+    """
+
+    FAIL_SCRIPT = """
+    if redis.call('HGET', KEYS[2], ARGV[1]) ~= ARGV[2] then
+        return 0
+    end
+    redis.call('ZREM', KEYS[1], ARGV[1])
+    redis.call('HDEL', KEYS[2], ARGV[1])
+    redis.call('SADD', KEYS[3], ARGV[1])
+    return 1
+    """
+
+    RELEASE_SCRIPT = SERVER_TIME + """
+    if redis.call('HGET', KEYS[2], ARGV[1]) == ARGV[2] and redis.call('ZSCORE', KEYS[1], ARGV[1]) then
+        redis.call('ZADD', KEYS[1], now + tonumber(ARGV[3]), ARGV[1])
+        redis.call('HDEL', KEYS[2], ARGV[1])
+        return 1
+    end
+    return 0
+    """
+
+    REQUEUE_FAILED_SCRIPT = """
+    local urls = redis.call('SMEMBERS', KEYS[3])
+    for i, url in ipairs(urls) do
+        redis.call('ZADD', KEYS[1], 0, url)
+        redis.call('HDEL', KEYS[2], url)
+    end
+    redis.call('DEL', KEYS[3])
+    return #urls
+    """
+
+    # Only URLs that carry a token and have not reached their visibility
+    # time count as leased; released retries waiting out a delay have no
+    # token and count as pending, as in SQLiteQueue.
+    STATS_SCRIPT = SERVER_TIME + """
+    local leased = 0
+    for i, url in ipairs(redis.call('HKEYS', KEYS[2])) do
+        local score = redis.call('ZSCORE', KEYS[1], url)
+        if score and tonumber(score) > now then
+            leased = leased + 1
+        end
+    end
+    return {redis.call('ZCARD', KEYS[1]) - leased, leased, redis.call('SCARD', KEYS[3]), redis.call('SCARD', KEYS[4])}
+    """
+
+    def __init__(self, client, prefix='editorial', visibility_timeout=DEFAULT_VISIBILITY_TIMEOUT, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        super().__init__(visibility_timeout, max_attempts)
+        self.client = client
+        self.pending_key = f'{prefix}:pending'
+        self.attempts_key = f'{prefix}:attempts'
+        self.tokens_key = f'{prefix}:tokens'
+        self.done_key = f'{prefix}:done'
+        self.failed_key = f'{prefix}:failed'
+
+        self._put = client.register_script(self.PUT_SCRIPT)
+        self._lease = client.register_script(self.LEASE_SCRIPT)
+        self._extend = client.register_script(self.EXTEND_SCRIPT)
+        self._ack = client.register_script(self.ACK_SCRIPT)
+        self._fail = client.register_script(self.FAIL_SCRIPT)
+        self._release = client.register_script(self.RELEASE_SCRIPT)
+        self._requeue_failed = client.register_script(self.REQUEUE_FAILED_SCRIPT)
+        self._stats = client.register_script(self.STATS_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url, **kwargs):
+        import redis
+        return cls(redis.Redis.from_url(url, decode_responses=True), **kwargs)
+
+    def put(self, urls, chunk_size=500):
+        added = 0
+        chunk = []
+
+        for url in urls:
+            chunk.append(url)
+            if len(chunk) >= chunk_size:
+                added += self._put(keys=[self.pending_key, self.done_key, self.failed_key], args=chunk)
+                chunk = []
+
+        if chunk:
+            added += self._put(keys=[self.pending_key, self.done_key, self.failed_key], args=chunk)
+
+        return added
+
+    def lease(self, worker_id, count=1):
+        token = f'{worker_id}:{uuid.uuid4().hex}'
+        result = self._lease(
+            keys=[self.pending_key, self.attempts_key, self.tokens_key, self.failed_key],
+            args=[self.visibility_timeout, count, self.max_attempts, token]
+        )
+        return [Lease(result[i], token, int(result[i + 1])) for i in range(0, len(result), 2)]
+
+    def extend(self, lease):
+        return bool(self._extend(
+            keys=[self.pending_key, self.tokens_key],
+            args=[lease.url, lease.token, self.visibility_timeout]
+        ))
+
+    def ack(self, lease):
+        return bool(self._ack(
+            keys=[self.pending_key, self.tokens_key, self.attempts_key, self.done_key],
+            args=[lease.url, lease.token]
+        ))
+
+    def fail(self, lease):
+        return bool(self._fail(
+            keys=[self.pending_key, self.tokens_key, self.failed_key],
+            args=[lease.url, lease.token]
+        ))
+
+    def release(self, lease, delay=0):
+        return bool(self._release(
+            keys=[self.pending_key, self.tokens_key],
+            args=[lease.url, lease.token, delay]
+        ))
+
+    def requeue_failed(self):
+        return self._requeue_failed(keys=[self.pending_key, self.attempts_key, self.failed_key])
+
+    def stats(self):
+        pending, leased, done, failed = self._stats(
+            keys=[self.pending_key, self.tokens_key, self.done_key, self.failed_key]
+        )
+        return {'pending': pending, 'leased': leased, 'done': done, 'failed': failed}
+
+    def close(self):
+        self.client.close()
+
+
+def open_queue(spec, **kwargs):
+    if spec.startswith(('redis://', 'rediss://', 'unix://')):
+        return RedisQueue.from_url(spec, **kwargs)
+    if spec.startswith('sqlite:///'):
+        spec = spec[len('sqlite:///'):]
+    return SQLiteQueue(spec, **kwargs)
@@ -1,304 +1,7 @@
 #!/usr/bin/env python3
-import os
-import time
-import re
-from datetime import datetime
-from urllib.parse import urljoin, urlparse
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
-
-
-class KoreanEditorialScraper:
-    def __init__(self, site_name, base_url, output_dir='articles'):
-        self.site_name = site_name
-        self.base_url = base_url
-        self.output_dir = os.path.join(output_dir, site_name)
-        self.driver = None
-        
-        # Site-specific configurations
-        self.configs = {
-            'chosun': {
-                'link_pattern': '/opinion/editorial/',
-                'title_selectors': ['h1', {'tag': ['h1', 'h2'], 'class': ['title', 'headline']}],
-                'date_selectors': ['time', {'class': 'date'}],
-                'author_selectors': [{'class': 'author'}],
-                'content_selectors': ['article', {'class': ['article', 'content', 'body']}],
-                'url_depth': 6
-            },
-            'joongang': {
-                'link_pattern': '/opinion/editorial/',
-                'title_selectors': ['h1', {'class': 'headline'}],
-                'date_selectors': ['time', {'class': ['date', 'published']}],
-                'author_selectors': [{'class': 'author'}, {'class': 'byline'}],
-                'content_selectors': ['article', {'class': ['article_body', 'article-content']}],
-                'url_depth': 5
-            },
-            'donga': {
-                'link_pattern': '/news/Opinion/',
-                'title_selectors': ['h1', {'class': 'title'}],
-                'date_selectors': ['time', {'class': ['date', 'input_date']}],
-                'author_selectors': [{'class': 'author'}, {'class': 'reporter'}],
-                'content_selectors': ['article', {'class': ['article_txt', 'article_content']}],
-                'url_depth': 5
-            },
-            'hani': {
-                'link_pattern': '/arti/opinion/editorial/',
-                'title_selectors': ['h4', {'class': 'title'}, {'tag': 'h3'}],
-                'date_selectors': ['p', {'class': 'date-time'}],
-                'author_selectors': [{'class': 'author'}, {'class': 'reporter_name'}],
-                'content_selectors': ['div', {'class': ['article-text', 'text']}],
-                'url_depth': 5
-            },
-            'khan': {
-                'link_pattern': '/opinion/editorial/',
-                'title_selectors': ['h1', {'class': 'title'}],
-                'date_selectors': ['p', {'class': 'date'}],
-                'author_selectors': [{'class': 'author'}],
-                'content_selectors': ['div', {'class': ['article_body', 'content']}],
-                'url_depth': 6
-            }
-        }
-        
-        self.config = self.configs.get(site_name, self.configs['chosun'])
-        
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
-    
-    def setup_driver(self):
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-        
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.implicitly_wait(10)
-    
-    def get_article_links(self):
-        print(f"Fetching article list from {self.base_url}...")
-        self.driver.get(self.base_url)
-        
-        time.sleep(5)
-        
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-        
-        article_links = set()
-        pattern = self.config['link_pattern']
-        min_depth = self.config['url_depth']
-        
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            
-            if pattern in href and href != self.base_url:
-                if not href.startswith('http'):
-                    href = urljoin(self.base_url, href)
-                
-                if href.count('/') >= min_depth and any(year in href for year in ['2024', '2025', '2023']):
-                    article_links.add(href)
-        
-        print(f"Found {len(article_links)} article links")
-        return list(article_links)
-    
-    def sanitize_filename(self, text):
-        text = re.sub(r'[<>:"/\\|?*]', '', text)
-        text = re.sub(r'\s+', '_', text)
-        return text[:100]
-    
-    def extract_article_content(self, url):
-        print(f"\nScraping: {url}")
-        self.driver.get(url)
-        
-        time.sleep(3)
-        
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-        
-        title = self._extract_title(soup)
-        date = self._extract_date(soup)
-        author = self._extract_author(soup)
-        content_paragraphs = self._extract_content(soup)
-        
-        return {
-            'title': title,
-            'date': date,
-            'author': author,
-            'content': content_paragraphs,
-            'url': url
-        }
-    
-    def _extract_title(self, soup):
-        title = ''
-        
-        for selector in self.config['title_selectors']:
-            if isinstance(selector, str):
-                tag = soup.find(selector)
-                if tag:
-                    title = tag.get_text(strip=True)
-                    break
-            elif isinstance(selector, dict):
-                if 'tag' in selector and 'class' in selector:
-                    tags = selector['tag']
-                    classes = selector['class']
-                    if isinstance(tags, str):
-                        tags = [tags]
-                    if isinstance(classes, str):
-                        classes = [classes]
-                    
-                    for tag_name in tags:
-                        for class_name in classes:
-                            elements = soup.find_all(tag_name, class_=lambda x: x and class_name in str(x).lower())
-                            if elements:
-                                title = elements[0].get_text(strip=True)
-                                return title
-                elif 'tag' in selector:
-                    tags = selector['tag'] if isinstance(selector['tag'], list) else [selector['tag']]
-                    for tag_name in tags:
-                        tag = soup.find(tag_name)
-                        if tag:
-                            title = tag.get_text(strip=True)
-                            return title
-                elif 'class' in selector:
-                    classes = selector['class'] if isinstance(selector['class'], list) else [selector['class']]
-                    for class_name in classes:
-                        elements = soup.find_all(class_=lambda x: x and class_name in str(x).lower())
-                        if elements:
-                            title = elements[0].get_text(strip=True)
-                            return title
-        
-        return title
-    
-    def _extract_date(self, soup):
-        date = ''
-        
-        for selector in self.config['date_selectors']:
-            if selector == 'time':
-                tag = soup.find('time')
-                if tag:
-                    date = tag.get('datetime', '') or tag.get_text(strip=True)
-                    break
-            elif selector == 'p':
-                tag = soup.find('p', class_=lambda x: x and 'date' in str(x).lower())
-                if tag:
-                    date = tag.get_text(strip=True)
-                    break
-            elif isinstance(selector, dict) and 'class' in selector:
-                classes = selector['class'] if isinstance(selector['class'], list) else [selector['class']]
-                for class_name in classes:
-                    elements = soup.find_all(class_=lambda x: x and class_name in str(x).lower())
-                    if elements:
-                        date = elements[0].get_text(strip=True)
-                        return date
-        
-        return date
-    
-    def _extract_author(self, soup):
-        author = ''
-        
-        for selector in self.config['author_selectors']:
-            if isinstance(selector, dict) and 'class' in selector:
-                classes = selector['class'] if isinstance(selector['class'], list) else [selector['class']]
-                for class_name in classes:
-                    elements = soup.find_all(class_=lambda x: x and class_name in str(x).lower())
-                    if elements:
-                        author = elements[0].get_text(strip=True)
-                        return author
-        
-        return author
-    
-    def _extract_content(self, soup):
-        content_paragraphs = []
-        article_body = None
-        
-        for selector in self.config['content_selectors']:
-            if selector == 'article':
-                article_body = soup.find('article')
-                if article_body:
-                    break
-            elif isinstance(selector, dict) and 'class' in selector:
-                classes = selector['class'] if isinstance(selector['class'], list) else [selector['class']]
-                for class_name in classes:
-                    article_body = soup.find('div', class_=lambda x: x and class_name in str(x).lower())
-                    if article_body:
-                        break
-        
-        if not article_body:
-            article_body = soup.find('div', class_=lambda x: x and any(term in str(x).lower() for term in ['article', 'content', 'body']))
-        
-        if article_body:
-            for p in article_body.find_all(['p', 'div'], class_=lambda x: not x or 'ad' not in str(x).lower()):
-                text = p.get_text(strip=True)
-                if text and len(text) > 20 and '©' not in text and 'copyright' not in text.lower() and 'advertisement' not in text.lower():
-                    content_paragraphs.append(text)
-        else:
-            for p in soup.find_all('p'):
-                text = p.get_text(strip=True)
-                if text and len(text) > 30 and '©' not in text and any(c.isalnum() for c in text):
-                    content_paragraphs.append(text)
-        
-        return content_paragraphs
-    
-    def save_to_markdown(self, article_data):
-        if not article_data['title']:
-            print("  ⚠️  No title found, skipping...")
-            return
-        
-        filename = self.sanitize_filename(article_data['title']) + '.md'
-        filepath = os.path.join(self.output_dir, filename)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(f"# {article_data['title']}\n\n")
-            
-            if article_data['date']:
-                f.write(f"**날짜:** {article_data['date']}\n\n")
-            
-            if article_data['author']:
-                f.write(f"**저자:** {article_data['author']}\n\n")
-            
-            f.write(f"**출처:** [{article_data['url']}]({article_data['url']})\n\n")
-            f.write("---\n\n")
-            
-            for paragraph in article_data['content']:
-                f.write(f"{paragraph}\n\n")
-        
-        print(f"  ✓ Saved to {filename}")
-    
-    def run(self):
-        try:
-            self.setup_driver()
-            
-            article_links = self.get_article_links()
-            
-            if not article_links:
-                print("No articles found!")
-                return
-            
-            print(f"\nStarting to scrape {len(article_links)} articles...\n")
-            
-            for i, link in enumerate(article_links, 1):
-                print(f"[{i}/{len(article_links)}]", end=' ')
-                
-                try:
-                    article_data = self.extract_article_content(link)
-                    self.save_to_markdown(article_data)
-                except Exception as e:
-                    print(f"  ✗ Error: {e}")
-                
-                time.sleep(2)
-            
-            print(f"\n✓ Scraping complete! Articles saved to '{self.output_dir}/' directory")
-            
-        except Exception as e:
-            print(f"Error: {e}")
-        finally:
-            if self.driver:
-                self.driver.quit()
+import sys
+from editorial.cli import main
 
 
 if __name__ == '__main__':
-    scraper = ChosunEditorialScraper()
-    scraper.run()
+    sys.exit(main(['discover'] + sys.argv[1:]))
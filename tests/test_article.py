@@ -0,0 +1,50 @@
+from datetime import datetime
+
+import pytest
+
+from editorial.article import KST, Article, parse_date
+
+
+@pytest.mark.parametrize('site', ['chosun', 'joongang', 'donga', 'hani', 'khan', None])
+@pytest.mark.parametrize('text, expected', [
+    ('2025-01-05T18:30:00+09:00', datetime(2025, 1, 5, 18, 30, tzinfo=KST)),
+    ('2025-01-05T20:00:00Z', datetime(2025, 1, 6, 5, 0, tzinfo=KST)),
+    ('2025-01-04T15:00:00.123Z', datetime(2025, 1, 5, 0, 0, 0, 123000, tzinfo=KST)),
+    ('2025-01-05', datetime(2025, 1, 5, tzinfo=KST)),
+])
+def test_iso_dates_parse_the_same_for_every_site(site, text, expected):
+    assert parse_date(text, site) == expected
+
+
+@pytest.mark.parametrize('site, text, expected', [
+    ('chosun', '입력 2025.01.05. 오후 3:07', datetime(2025, 1, 5, 15, 7, tzinfo=KST)),
+    ('joongang', '2025.01.05 00:01', datetime(2025, 1, 5, 0, 1, tzinfo=KST)),
+    ('donga', '입력 2025-01-05 03:00:00', datetime(2025, 1, 5, 3, 0, tzinfo=KST)),
+    ('hani', '등록 2025-01-05 18:00 수정 2025-01-06 09:00', datetime(2025, 1, 5, 18, 0, tzinfo=KST)),
+    ('khan', '2025.01.05 오전 12:30', datetime(2025, 1, 5, 0, 30, tzinfo=KST)),
+    ('donga', '입력 2025-01-05T18:30:00+09:00', datetime(2025, 1, 5, 18, 30, tzinfo=KST)),
+    ('hani', '2025년 1월 5일 20:00', datetime(2025, 1, 5, 20, 0, tzinfo=KST)),
+    ('hani', '수정 2025-01-06 09:00 등록 2025-01-05 18:00', datetime(2025, 1, 5, 18, 0, tzinfo=KST)),
+    ('donga', '업데이트 2025-01-06 09:00:00 | 입력 2025-01-05 23:03:00', datetime(2025, 1, 5, 23, 3, tzinfo=KST)),
+    ('chosun', '업데이트 2025.01.06. 09:00 입력 2025.01.05. 00:01', datetime(2025, 1, 5, 0, 1, tzinfo=KST)),
+    ('khan', '최종수정 2025.01.06 09:00 입력 2025.01.05 18:00', datetime(2025, 1, 5, 18, 0, tzinfo=KST)),
+    ('joongang', '업데이트 2025.01.06 09:00 입력 2025.01.05 00:01', datetime(2025, 1, 5, 0, 1, tzinfo=KST)),
+])
+def test_site_date_lines(site, text, expected):
+    assert parse_date(text, site) == expected
+
+
+@pytest.mark.parametrize('text', ['', '어제', None, 5])
+def test_unparseable_dates(text):
+    assert parse_date(text, 'chosun') is None
+
+
+def test_record_round_trip_keeps_raw_date_only_when_unparsed():
+    parsed = Article.from_fields('u', title='t', date='2025-01-05T18:30:00+09:00', content=['a\nb', 'c'])
+    unparsed = Article.from_fields('v', title='t', date='어제')
+
+    assert parsed.date_text == ''
+    assert parsed.content == ['a b', 'c']
+    assert Article.from_json(parsed.to_json()) == parsed
+    assert unparsed.date == '어제'
+    assert sorted([unparsed, parsed], key=Article.sort_key)[0] is parsed
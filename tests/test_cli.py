@@ -0,0 +1,20 @@
+from editorial.cli import build_parser
+
+
+def parse(argv):
+    parser = build_parser()
+    return parser.commands[argv[0]].parse_intermixed_args(argv[1:])
+
+
+def test_manual_accepts_options_after_urls():
+    args = parse(['manual', '-', '--file', 'urls.gz', 'https://www.chosun.com/opinion/editorial/2025/01/05/ABC/'])
+
+    assert args.inputs == ['-', 'https://www.chosun.com/opinion/editorial/2025/01/05/ABC/']
+    assert args.file == ['urls.gz']
+
+
+def test_coordinator_accepts_options_between_urls():
+    args = parse(['coordinator', 'https://a.example/1', '--queue', 'queue.db', 'https://a.example/2'])
+
+    assert args.inputs == ['https://a.example/1', 'https://a.example/2']
+    assert args.queue == 'queue.db'
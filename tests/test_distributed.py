@@ -0,0 +1,104 @@
+import requests
+
+from editorial.distributed import Worker
+from editorial.fetchers import Fetcher
+from editorial.quality import QualityMonitor
+from editorial.workqueue import SQLiteQueue
+
+
+URLS = ['https://a.example/1', 'https://a.example/2']
+
+
+class PageFetcher(Fetcher):
+    def __init__(self):
+        super().__init__(delay=0)
+        self.fetched = []
+        self.on_fetch = None
+        self.status_codes = {}
+
+    def fetch(self, url):
+        self.fetched.append(url)
+        if self.on_fetch:
+            self.on_fetch()
+        if url in self.status_codes:
+            response = requests.Response()
+            response.status_code = self.status_codes[url]
+            raise requests.HTTPError(f'{response.status_code} error', response=response)
+        return '<html></html>'
+
+
+class StubScraper:
+    def __init__(self, saved):
+        self.fetcher = PageFetcher()
+        self.quality_monitor = QualityMonitor('chosun')
+        self.saved = saved
+
+    def scrape_article(self, url, raw):
+        return self.saved
+
+
+def make_worker(tmp_path, saved=True, **queue_options):
+    queue = SQLiteQueue(str(tmp_path / 'queue.db'), **queue_options)
+    queue.put(URLS)
+    return queue, Worker(queue, StubScraper(saved), worker_id='w1', batch_size=2, retry_delay=0)
+
+
+def test_lease_is_extended_before_its_url_is_fetched(tmp_path):
+    queue, worker = make_worker(tmp_path, visibility_timeout=0)
+
+    leases = queue.lease('w1', 2)
+    queue.visibility_timeout = 300
+    stolen = []
+    worker.scraper.fetcher.on_fetch = lambda: stolen.extend(lease.url for lease in queue.lease('w2', 2))
+    worker.process(leases)
+
+    # The second URL had already expired when the first was fetched.
+    assert stolen == [URLS[1]]
+    assert worker.scraper.fetcher.fetched == [URLS[0]]
+    assert queue.stats()['done'] == 1
+
+
+def test_urls_leased_by_another_worker_are_skipped(tmp_path):
+    queue, worker = make_worker(tmp_path, visibility_timeout=0)
+
+    stale = queue.lease('w1', 2)
+    queue.lease('w2', 2)
+    worker.process(stale)
+
+    assert worker.scraper.fetcher.fetched == []
+    assert queue.stats()['done'] == 0
+
+
+def test_rejected_urls_are_retried_until_max_attempts(tmp_path):
+    queue, worker = make_worker(tmp_path, saved=False, max_attempts=2)
+
+    assert worker.run() == 0
+
+    assert worker.stats['rejected'] == 4
+    assert queue.stats() == {'pending': 0, 'leased': 0, 'done': 0, 'failed': 2}
+
+
+def test_permanent_http_errors_fail_without_retrying(tmp_path):
+    queue, worker = make_worker(tmp_path, max_attempts=3)
+    worker.scraper.fetcher.status_codes = {URLS[0]: 404, URLS[1]: 503}
+
+    assert worker.run() == 0
+
+    assert worker.scraper.fetcher.fetched.count(URLS[0]) == 1
+    assert worker.scraper.fetcher.fetched.count(URLS[1]) == 3
+    assert worker.stats['failed'] == 1
+    assert worker.stats['retried'] == 3
+    assert queue.stats()['failed'] == 2
+
+
+def test_lost_lease_is_not_counted_as_saved(tmp_path):
+    queue, worker = make_worker(tmp_path, visibility_timeout=0)
+
+    # Another worker takes the URL over while this one is fetching it.
+    worker.scraper.fetcher.on_fetch = lambda: queue.lease('w2', 2)
+    leases = queue.lease('w1', 1)
+    worker.process(leases)
+
+    assert worker.stats['successful'] == 0
+    assert worker.stats['lost'] == 1
+    assert queue.stats()['done'] == 0
@@ -0,0 +1,31 @@
+from editorial.extractors import create_extractor
+
+
+PAGE = (
+    "<html><body><div class='article-body'>"
+    "<p>홍길동 기자 hong@example.com 정리한 내용입니다</p>"
+    "<p>자세한 내용은 chosun.com 에서 확인할 수 있습니다</p>"
+    "<p>본문 문단이 여기에 충분히 길게 이어지고 있습니다.</p>"
+    "</div></body></html>"
+)
+
+
+def test_manual_mode_filters_site_footer():
+    content = create_extractor('generic').extract('https://example.com/a', PAGE).content
+
+    assert content == ['홍길동 기자 hong@example.com 정리한 내용입니다', '본문 문단이 여기에 충분히 길게 이어지고 있습니다.']
+
+
+def test_scrape_mode_filters_bylines():
+    content = create_extractor('simple').extract('https://example.com/a', PAGE).content
+
+    assert content == ['자세한 내용은 chosun.com 에서 확인할 수 있습니다', '본문 문단이 여기에 충분히 길게 이어지고 있습니다.']
+
+
+def test_page_without_article_container_scores_zero():
+    page = "<html><body>" + "<p>사이드바에 걸린 다른 기사 제목이 길게 이어지는 링크 문단입니다</p>" * 20 + "</body></html>"
+
+    for name in ('site', 'generic', 'simple'):
+        article, quality = create_extractor(name).extract_scored('https://example.com/a', page)
+        assert article.content == []
+        assert quality.score == 0.0
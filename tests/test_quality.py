@@ -0,0 +1,32 @@
+import pytest
+
+from editorial.quality import QualityCollapse, QualityMonitor, score_extraction
+
+
+ARTICLE = ['이것은 사설의 본문 단락으로, 충분히 긴 텍스트를 포함하고 있습니다. 정부 정책에 대한 논평입니다.'] * 1
+PARAGRAPHS = [f'{i}번째 단락: ' + ARTICLE[0] * 3 for i in range(8)]
+
+
+def test_low_density_lowers_score():
+    dense = score_extraction(PARAGRAPHS, page_text_length=1500)
+    sparse = score_extraction(PARAGRAPHS, page_text_length=100000)
+
+    assert dense.density > 0.9
+    assert sparse.score < dense.score * 0.55
+
+
+def test_monitor_uses_its_own_threshold():
+    quality = score_extraction(PARAGRAPHS)
+
+    assert QualityMonitor('chosun', threshold=0.5).accepts(quality)
+    assert not QualityMonitor('chosun', threshold=quality.score + 0.01).accepts(quality)
+
+
+def test_monitor_collapses_after_a_window_of_low_scores():
+    monitor = QualityMonitor('chosun', window=3)
+
+    for _ in range(3):
+        monitor.record(score_extraction(['Copyright © chosun.com'] * 3))
+
+    with pytest.raises(QualityCollapse):
+        monitor.check()
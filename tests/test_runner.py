@@ -0,0 +1,68 @@
+from editorial.article import Article
+from editorial.fetchers import Fetcher
+from editorial.quality import score_extraction
+from editorial.runner import Scraper
+from editorial.sinks import MarkdownSink
+
+
+BODY = [f'{i}번째 문단: 정부의 정책 결정 과정에 대해 사설은 충분히 긴 문장으로 논평하고 있습니다. ' * 4 for i in range(5)]
+
+
+class RecordingFetcher(Fetcher):
+    def __init__(self):
+        super().__init__(delay=0)
+        self.fetched = []
+
+    def fetch(self, url):
+        self.fetched.append(url)
+        return '<html></html>'
+
+
+class StubExtractor:
+    site_name = 'chosun'
+
+    def extract_scored(self, url, raw):
+        article = Article.from_fields(url, title=f'사설 {url.rsplit("/", 1)[-1]}', content=BODY)
+        return article, score_extraction(article.content)
+
+
+def make_scraper(tmp_path, **options):
+    sink = MarkdownSink(str(tmp_path))
+    sink.save(Article.from_fields('https://example.com/old', title='이미 저장된 사설', content=BODY))
+    return Scraper(RecordingFetcher(), StubExtractor(), sink, **options)
+
+
+LINES = [
+    '# comment\n',
+    '\n',
+    'https://example.com/old?utm_source=rss\n',
+    'not a url\n',
+    'https://example.com/new\n',
+    'https://EXAMPLE.com/new#top\n',
+]
+
+
+def test_skips_saved_urls_and_counts_invalid_lines(tmp_path):
+    scraper = make_scraper(tmp_path)
+
+    stats = scraper.scrape(iter(LINES))
+
+    assert scraper.fetcher.fetched == ['https://example.com/new', 'https://example.com/new']
+    assert stats == {'successful': 2, 'failed': 0, 'skipped': 1, 'invalid': 1}
+
+
+def test_dedup_input_drops_repeats(tmp_path):
+    scraper = make_scraper(tmp_path, dedup_input=True)
+
+    stats = scraper.scrape(iter(LINES))
+
+    assert scraper.fetcher.fetched == ['https://example.com/new']
+    assert stats['skipped'] == 2
+
+
+def test_force_ignores_saved_urls(tmp_path):
+    scraper = make_scraper(tmp_path, skip_existing=False)
+
+    scraper.scrape(iter(LINES))
+
+    assert scraper.fetcher.fetched[0] == 'https://example.com/old'
@@ -0,0 +1,25 @@
+from editorial.article import Article
+from editorial.sinks import JsonLinesSink, MarkdownSink
+
+
+def make_article(url):
+    return Article.from_fields(url, title='사설 제목', date='2025-01-05T09:00:00+09:00', content=['본문 문단'])
+
+
+def test_markdown_sink_lists_saved_urls(tmp_path):
+    sink = MarkdownSink(str(tmp_path))
+    assert sink.save(make_article('https://www.chosun.com/opinion/editorial/a/?utm_source=rss'))
+    (tmp_path / 'notes.md').write_text('# 메모\n\n---\n\n**출처:** [https://example.com/x](https://example.com/x)\n',
+                                       encoding='utf-8')
+
+    assert MarkdownSink(str(tmp_path)).scraped_urls() == {'https://www.chosun.com/opinion/editorial/a/'}
+
+
+def test_jsonl_sink_lists_saved_urls(tmp_path):
+    sink = JsonLinesSink(str(tmp_path))
+    assert sink.save(make_article('https://www.chosun.com/opinion/editorial/a/'))
+    sink.close()
+    with open(sink.filepath, 'a', encoding='utf-8') as f:
+        f.write('not json\n["too", "short"]\n')
+
+    assert JsonLinesSink(str(tmp_path)).scraped_urls() == {'https://www.chosun.com/opinion/editorial/a/'}
@@ -0,0 +1,132 @@
+import json
+
+import pytest
+
+from editorial import extractors
+from editorial.extractors import create_extractor
+from editorial.structured_data import (
+    extract_fusion, extract_json_ld, extract_meta, extract_structured_article, is_complete
+)
+
+
+STORY = {
+    'headlines': {'basic': '[사설] 정책의 <b>방향</b>'},
+    'display_date': '2025-01-05T09:00:00Z',
+    'credits': {'by': [{'name': '논설위원실'}, {'byline': '홍길동'}]},
+    'content_elements': [
+        {'type': 'text', 'content': '첫 문단입니다.'},
+        {'type': 'image', 'url': 'https://example.com/a.jpg'},
+        {'type': 'text', 'content': '둘째 문단<br>이어짐'},
+    ],
+}
+
+META = (
+    '<meta property="og:title" content="메타 제목 &amp; 부제">'
+    '<meta property="article:published_time" content="2025-01-04T18:00:00+09:00">'
+    '<meta name="author" content="메타 기자">'
+)
+
+
+def page(head='', body=''):
+    return f'<html><head>{head}</head><body>{body}</body></html>'
+
+
+def fusion(story):
+    return f'<script>Fusion.globalContent={json.dumps(story, ensure_ascii=False)};Fusion.spa=true;</script>'
+
+
+def json_ld(data):
+    return f'<script type="application/ld+json">{json.dumps(data, ensure_ascii=False)}</script>'
+
+
+def test_fusion_payload_is_decoded():
+    article = extract_fusion(page(body=fusion(STORY)).encode('utf-8'))
+
+    assert article == {
+        'title': '[사설] 정책의 방향',
+        'date': '2025-01-05T09:00:00Z',
+        'author': '논설위원실, 홍길동',
+        'content': ['첫 문단입니다.', '둘째 문단 이어짐'],
+    }
+
+
+@pytest.mark.parametrize('data', [
+    {'@context': 'https://schema.org', '@graph': [
+        {'@type': 'WebPage', 'name': '페이지'},
+        {'@type': 'NewsArticle', 'headline': '그래프 제목', 'articleBody': '하나\n둘'},
+    ]},
+    [{'@type': 'BreadcrumbList'}, {'@type': ['Article', 'OpinionNewsArticle'], 'name': '그래프 제목',
+                                   'articleBody': '하나<br/>둘'}],
+])
+def test_json_ld_graph_and_list_nodes(data):
+    article = extract_json_ld(page(head=json_ld(data)).encode('utf-8'))
+
+    assert article['title'] == '그래프 제목'
+    assert article['content'] == ['하나', '둘']
+
+
+def test_json_ld_allows_raw_newlines_in_strings():
+    raw = page(head='<script type="application/ld+json">{"@type": "NewsArticle", "headline": "제목",'
+                    ' "articleBody": "첫 문단\n\t둘째 문단"}</script>')
+
+    assert extract_json_ld(raw.encode('utf-8'))['content'] == ['첫 문단', '둘째 문단']
+
+
+def test_meta_fallback():
+    article = extract_meta(page(head=META).encode('utf-8'))
+
+    assert article == {
+        'title': '메타 제목 & 부제',
+        'date': '2025-01-04T18:00:00+09:00',
+        'author': '메타 기자',
+        'content': [],
+    }
+    assert not is_complete(article)
+
+
+def test_tiers_merge_in_order():
+    story = dict(STORY, display_date=None)
+    ld = {'@type': 'NewsArticle', 'headline': 'JSON-LD 제목', 'datePublished': '2025-01-03T12:00:00+09:00',
+          'articleBody': 'JSON-LD 본문'}
+    raw = page(head=META + json_ld(ld), body=fusion(story))
+
+    article = extract_structured_article(raw)
+
+    assert article['title'] == '[사설] 정책의 방향'
+    assert article['date'] == '2025-01-03T12:00:00+09:00'
+    assert article['author'] == '논설위원실, 홍길동'
+    assert article['content'] == ['첫 문단입니다.', '둘째 문단 이어짐']
+
+
+def test_wrongly_typed_fields_are_ignored():
+    story = {'headlines': ['not', 'a', 'dict'], 'display_date': 20250105,
+             'credits': {'by': 'plain string'}, 'content_elements': {'type': 'text'}}
+    ld = [{'@type': 'NewsArticle', 'headline': {'ko': '제목'}, 'articleBody': ['문단'], 'author': 42}]
+    raw = page(head=META + json_ld(ld), body=fusion(story))
+
+    article = extract_structured_article(raw)
+
+    assert article['title'] == '메타 제목 & 부제'
+    assert article['date'] == '2025-01-04T18:00:00+09:00'
+    assert article['author'] == 'plain string'
+    assert article['content'] == []
+
+
+def test_complete_structured_data_skips_soup(monkeypatch):
+    def no_soup(raw):
+        raise AssertionError('soup should not be built')
+
+    monkeypatch.setattr(extractors, 'make_soup', no_soup)
+    article = create_extractor('generic').extract('https://example.com/a', page(body=fusion(STORY)))
+
+    assert article.title == '[사설] 정책의 방향'
+    assert article.published.isoformat() == '2025-01-05T18:00:00+09:00'
+
+
+def test_incomplete_structured_data_falls_back_to_soup():
+    body = "<div class='article-body'><p>본문 문단이 여기에 충분히 길게 이어지고 있습니다.</p></div>"
+    article = create_extractor('generic').extract('https://example.com/a', page(head=META, body=body))
+
+    assert article.title == '메타 제목 & 부제'
+    assert article.author == '메타 기자'
+    assert article.content == ['본문 문단이 여기에 충분히 길게 이어지고 있습니다.']
@@ -0,0 +1,31 @@
+from editorial.extractors import SITE_CONFIGS, collect_paragraphs, find_article_body, make_soup
+from editorial.tuning import propose_config, rank_selectors
+
+
+PARAGRAPHS = ''.join(
+    f"<p>{i}번째 문단입니다. 정부의 정책 결정 과정에 대해 사설은 충분히 긴 문장으로 논평하고 있습니다.</p>"
+    for i in range(8)
+)
+NAV = "<div class='nav'><a href='/'>홈으로 가기 전체 메뉴 목록입니다</a><a href='/opinion'>오피니언 사설 칼럼 목록</a></div>"
+PAGE = (
+    "<html><body><div class='wrap'>" + NAV +
+    "<div class='article-text'>" + PARAGRAPHS + "</div>"
+    "</div></body></html>"
+)
+
+
+def test_wrapper_does_not_repeat_paragraphs():
+    soup = make_soup(PAGE)
+
+    wrapped = collect_paragraphs(find_article_body(soup, [{'class': 'wrap'}]))
+    body = collect_paragraphs(find_article_body(soup, [{'class': 'article-text'}]))
+
+    assert len(body) == 8
+    assert wrapped == body
+
+
+def test_tuner_prefers_innermost_body_over_wrapper():
+    ranking, baseline, structured = rank_selectors([PAGE, PAGE], SITE_CONFIGS['hani']['content_selectors'])
+
+    assert ranking[0][1] == {'class': 'article-text'}
+    assert propose_config(SITE_CONFIGS['hani'], ranking)['content_selectors'][0] == {'class': 'article-text'}
@@ -0,0 +1,49 @@
+import gzip
+import io
+import sys
+
+import pytest
+
+from editorial.urls import canonicalize_url, iter_lines
+
+
+@pytest.mark.parametrize('line, expected', [
+    ('  HTTPS://WWW.Chosun.com/opinion/editorial/2025/01/05/ABC/#comments\n',
+     'https://www.chosun.com/opinion/editorial/2025/01/05/ABC/'),
+    ('https://www.hani.co.kr/arti/opinion/editorial/1.html?utm_source=rss&fbclid=x',
+     'https://www.hani.co.kr/arti/opinion/editorial/1.html'),
+    ('https://www.khan.co.kr/view?1234', 'https://www.khan.co.kr/view?1234'),
+    ('https://example.com/a?path=/a/b&q=a%20b&gclid=1', 'https://example.com/a?path=/a/b&q=a%20b'),
+    ('https://example.com/a?id=1&amp', 'https://example.com/a?id=1&amp'),
+    ('https://example.com', 'https://example.com/'),
+])
+def test_canonicalize_url(line, expected):
+    assert canonicalize_url(line) == expected
+
+
+@pytest.mark.parametrize('line', ['', '   \n', '# comment', 'ftp://example.com/a', 'not a url', 'https:///path'])
+def test_canonicalize_url_rejects(line):
+    assert canonicalize_url(line) is None
+
+
+def test_iter_lines_reads_gzip_and_globs(tmp_path, capsys):
+    with gzip.open(tmp_path / 'a.txt.gz', 'wt', encoding='utf-8') as f:
+        f.write('https://example.com/1\nhttps://example.com/2\n')
+    (tmp_path / 'b.txt').write_text('https://example.com/3\n', encoding='utf-8')
+
+    lines = list(iter_lines([str(tmp_path / '*.txt*'), str(tmp_path / 'none-*.txt')]))
+
+    assert [line.strip() for line in lines] == ['https://example.com/1', 'https://example.com/2', 'https://example.com/3']
+    assert 'no files match' in capsys.readouterr().out
+
+
+def test_iter_lines_reads_stdin(monkeypatch):
+    monkeypatch.setattr(sys, 'stdin', io.StringIO('https://example.com/1\n'))
+
+    assert list(iter_lines(['-'])) == ['https://example.com/1\n']
+
+
+def test_iter_lines_skips_unreadable_files(tmp_path):
+    (tmp_path / 'ok.txt').write_text('https://example.com/1\n', encoding='utf-8')
+
+    assert list(iter_lines([str(tmp_path / 'missing.txt'), str(tmp_path / 'ok.txt')])) == ['https://example.com/1\n']
@@ -0,0 +1,127 @@
+from time import time as real_time
+from types import SimpleNamespace
+
+import pytest
+
+from editorial import workqueue
+from editorial.workqueue import RedisQueue, SQLiteQueue
+
+
+URL = 'https://www.chosun.com/opinion/editorial/2025/01/05/ABC/'
+
+
+@pytest.fixture(params=['sqlite', 'redis'])
+def make_queue(request, tmp_path):
+    queues = []
+
+    def make(**kwargs):
+        if request.param == 'sqlite':
+            queue = SQLiteQueue(str(tmp_path / 'queue.db'), **kwargs)
+        else:
+            fakeredis = pytest.importorskip('fakeredis')
+            pytest.importorskip('lupa')
+            queue = RedisQueue(fakeredis.FakeRedis(decode_responses=True), **kwargs)
+        queues.append(queue)
+        return queue
+
+    yield make
+
+    for queue in queues:
+        queue.close()
+
+
+def test_lease_and_ack(make_queue):
+    queue = make_queue()
+    assert queue.put([URL, URL]) == 1
+
+    [lease] = queue.lease('w1')
+    assert (lease.url, lease.attempts) == (URL, 1)
+    assert queue.lease('w2') == []
+
+    assert queue.ack(lease)
+    assert queue.stats() == {'pending': 0, 'leased': 0, 'done': 1, 'failed': 0}
+    assert queue.put([URL]) == 0
+
+
+def test_expired_lease_is_redelivered(make_queue):
+    queue = make_queue(visibility_timeout=0)
+    queue.put([URL])
+
+    first = queue.lease('w1')[0]
+    second = queue.lease('w2')[0]
+
+    assert second.attempts == 2
+    assert not queue.extend(first)
+    assert not queue.release(first)
+
+
+def test_stale_lease_cannot_finish_url(make_queue):
+    queue = make_queue(visibility_timeout=0)
+    queue.put([URL])
+
+    stale = queue.lease('w1')[0]
+    current = queue.lease('w2')[0]
+
+    assert not queue.fail(stale)
+    assert not queue.ack(stale)
+    assert queue.ack(current)
+    assert queue.stats()['done'] == 1
+    assert queue.stats()['failed'] == 0
+
+
+def test_released_lease_cannot_be_acknowledged(make_queue):
+    queue = make_queue()
+    queue.put([URL])
+
+    lease = queue.lease('w1')[0]
+    assert queue.release(lease)
+
+    assert not queue.ack(lease)
+    assert queue.lease('w2')[0].attempts == 2
+
+
+def test_url_fails_after_max_attempts(make_queue):
+    queue = make_queue(visibility_timeout=0, max_attempts=2)
+    queue.put([URL])
+
+    assert len(queue.lease('w1')) == 1
+    assert len(queue.lease('w1')) == 1
+    assert queue.lease('w1') == []
+    assert queue.stats()['failed'] == 1
+
+
+def test_requeue_failed(make_queue):
+    queue = make_queue(visibility_timeout=0, max_attempts=1)
+    queue.put([URL])
+
+    queue.lease('w1')
+    assert queue.lease('w1') == []
+    assert queue.put([URL]) == 0
+
+    assert queue.requeue_failed() == 1
+    assert queue.stats() == {'pending': 1, 'leased': 0, 'done': 0, 'failed': 0}
+    assert queue.lease('w1')[0].attempts == 1
+
+
+def test_delayed_retry_counts_as_pending(make_queue):
+    queue = make_queue()
+    queue.put([URL])
+
+    lease = queue.lease('w1')[0]
+    assert queue.stats()['leased'] == 1
+
+    queue.release(lease, delay=60)
+    assert queue.stats() == {'pending': 1, 'leased': 0, 'done': 0, 'failed': 0}
+    assert queue.lease('w1') == []
+
+
+def test_redis_leases_use_server_clock(monkeypatch):
+    fakeredis = pytest.importorskip('fakeredis')
+    pytest.importorskip('lupa')
+    queue = RedisQueue(fakeredis.FakeRedis(decode_responses=True))
+    queue.put([URL])
+    queue.lease('w1')
+
+    # A worker whose clock runs an hour fast must not see the lease as expired.
+    monkeypatch.setattr(workqueue, 'time', SimpleNamespace(time=lambda: real_time() + 3600))
+    assert queue.lease('w2') == []